@@ -4,36 +4,164 @@ Generate SEO files (sitemap.xml and robots.txt) for the GGUF Models website.
 This script creates the necessary SEO files for search engine optimization.
 """
 
-import json
+import gzip
+import hashlib
 import os
+import pickle
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+try:
+    # orjson is an optional, much faster drop-in for decoding large catalogs
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Get the repository name from environment or use default
+_REPO_NAME = os.getenv('GITHUB_REPOSITORY', 'username/gguf-models').split('/')[-1]
+BASE_URL = f"https://{os.getenv('GITHUB_REPOSITORY_OWNER', 'username')}.github.io/{_REPO_NAME}"
+
+MODELS_CACHE_FILE = Path('.cache/seo_models.pkl')
+
+# Maps model ids to URL slugs in a single pass ('/' -> '--', '_' -> '-'),
+# escaping XML special characters at the same time so slugs can be
+# dropped straight into <loc> elements
+_SLUG_TABLE = str.maketrans({
+    '/': '--',
+    '_': '-',
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+})
+
+ROBOTS_TMPL = """\
+# Robots.txt for GGUF Models Discovery Website
+# Generated automatically by data pipeline
+
+User-agent: *
+Allow: /
+Crawl-delay: 1
+
+# Sitemaps
+Sitemap: {sitemap}
+
+# Disallow crawling of API endpoints
+Disallow: /api/
+Disallow: /_next/
+Disallow: /admin/
+
+# Allow crawling of data files
+Allow: /data/
+Allow: /*.json
+Allow: /*.xml"""
+
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<!-- content-hash: {} -->\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_FOOTER = '</urlset>'
+SITEMAP_INDEX_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<!-- content-hash: {} -->\n'
+    '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_INDEX_FOOTER = '</sitemapindex>'
+SITEMAP_INDEX_ENTRY_TMPL = (
+    '  <sitemap>\n'
+    '    <loc>{}</loc>\n'
+    '    <lastmod>{}</lastmod>\n'
+    '  </sitemap>\n'
+)
+SITEMAP_BUFFER_SIZE = 1 << 16
+SITEMAP_GZIP_LEVEL = 6
+# Stay comfortably below the protocol's 50,000 URLs per sitemap file
+MAX_URLS_PER_SITEMAP = 45000
+_HASH_COMMENT_RE = re.compile(r'<!-- content-hash: ([0-9a-f]+) -->')
+_SHARD_NAME_RE = re.compile(r'sitemap-(\d+)\.xml(?:\.gz)?')
+URL_PREFIX = '  <url>\n    <loc>'
+URL_SUFFIX_TMPL = (
+    '</loc>\n'
+    '    <lastmod>{}</lastmod>\n'
+    '    <changefreq>{}</changefreq>\n'
+    '    <priority>{}</priority>\n'
+    '  </url>\n'
+)
 
 def load_existing_models():
     """Load existing models data if available."""
-    # Try the new data structure first
-    models_file = Path('data/models.json')
-    if models_file.exists():
-        with open(models_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('models', [])
+    # Try the new data structure first; opening directly (rather than
+    # checking exists() first) saves a stat and cannot race with a rewrite
+    try:
+        models_file = open('data/models.json', 'rb')
+    except FileNotFoundError:
+        pass
+    else:
+        with models_file as f:
+            stat = os.fstat(f.fileno())
+            header = (stat.st_mtime_ns, stat.st_size)
+            
+            # Reuse the projection cached by a previous run if models.json is unchanged
+            try:
+                with open(MODELS_CACHE_FILE, 'rb') as cache:
+                    cached_header, cached_models = pickle.load(cache)
+                if cached_header == header:
+                    return cached_models
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+                pass
+            
+            # Only the id and family are used when generating SEO files, so
+            # stream the models array when ijson is available rather than
+            # materializing the whole document
+            if ijson is not None:
+                items = ijson.items(f, 'models.item')
+            else:
+                items = _json.loads(f.read()).get('models', [])
+            models = [
+                {'id': model.get('id', ''), 'family': model.get('family', 'unknown')}
+                for model in items
+            ]
+        
+        try:
+            MODELS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(MODELS_CACHE_FILE, 'wb') as cache:
+                pickle.dump((header, models), cache, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Warning: could not write models cache: {e}")
+        
+        return models
     
     # Try the legacy gguf_models.json file
-    legacy_file = Path('gguf_models.json')
-    if legacy_file.exists():
-        with open(legacy_file, 'r', encoding='utf-8') as f:
-            legacy_models = json.load(f)
-            # Convert legacy format to new format
-            converted_models = []
-            for model in legacy_models:
-                model_id = model.get('modelId', '')
-                converted_models.append({
-                    'id': model_id,
-                    'name': model_id.split('/')[-1].replace('-', ' ').title() if model_id else 'Unknown',
-                    'family': model_id.split('/')[0] if '/' in model_id else 'unknown',
-                    'downloads': model.get('downloads', 0)
-                })
-            return converted_models
+    try:
+        legacy_file = open('gguf_models.json', 'rb')
+    except FileNotFoundError:
+        pass
+    else:
+        with legacy_file as f:
+            legacy_models = _json.loads(f.read())
+        # Convert legacy format to new format
+        converted_models = []
+        for model in legacy_models:
+            model_id = model.get('modelId', '')
+            converted_models.append({
+                'id': model_id,
+                'name': model_id.split('/')[-1].replace('-', ' ').title() if model_id else 'Unknown',
+                'family': model_id.split('/')[0] if '/' in model_id else 'unknown',
+                'downloads': model.get('downloads', 0)
+            })
+        return converted_models
     
     # Return sample data if no models file exists
     return [
@@ -49,102 +177,148 @@ def load_existing_models():
         }
     ]
 
+def _read_sitemap_hash(path):
+    """Return the content hash recorded in an existing sitemap, if any."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            f.readline()  # XML declaration
+            match = _HASH_COMMENT_RE.match(f.readline())
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+def _iter_url_blocks(models, families, current_date):
+    """Yield the formatted <url> block for every page in the sitemap."""
+    # Everything except the page location is fixed per category, so build
+    # the surrounding fragments once and only concatenate inside the loops
+    model_prefix = URL_PREFIX + escape(f'{BASE_URL}/model/')
+    model_suffix = URL_SUFFIX_TMPL.format(current_date, 'weekly', '0.6')
+    family_prefix = URL_PREFIX + escape(f'{BASE_URL}/family/')
+    family_suffix = URL_SUFFIX_TMPL.format(current_date, 'weekly', '0.5')
+    
+    # Main and search pages
+    yield URL_PREFIX + escape(f'{BASE_URL}/') + URL_SUFFIX_TMPL.format(current_date, 'daily', '1.0')
+    yield URL_PREFIX + escape(f'{BASE_URL}/search') + URL_SUFFIX_TMPL.format(current_date, 'daily', '0.8')
+    
+    # Model pages
+    for model in models:
+        yield model_prefix + model['id'].translate(_SLUG_TABLE) + model_suffix
+    
+    # Family pages
+    for family in families:
+        yield family_prefix + family.translate(_SLUG_TABLE).lower() + family_suffix
+
+@contextmanager
+def _atomic_writer(path, mode='w', **kwargs):
+    """Write to a temporary sibling of path and move it into place on success."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with open(fd, mode, **kwargs) as f:
+            yield f
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+def _write_gzip_copy(path):
+    """Publish a gzip-compressed copy of path next to it as path.gz."""
+    with open(path, 'rb') as src, _atomic_writer(f'{path}.gz', 'wb') as dst:
+        # A fixed mtime and no embedded file name keep the output reproducible
+        with gzip.GzipFile(filename='', mode='wb', fileobj=dst,
+                           compresslevel=SITEMAP_GZIP_LEVEL, mtime=0) as gz:
+            shutil.copyfileobj(src, gz, SITEMAP_BUFFER_SIZE)
+
+def _write_urlset(path, url_blocks, content_hash):
+    """Stream a <urlset> document made of the given <url> blocks to path."""
+    # A 64 KiB buffer batches the many small writes into a few syscalls
+    with _atomic_writer(path, 'w', encoding='utf-8', buffering=SITEMAP_BUFFER_SIZE) as f:
+        f.write(SITEMAP_HEADER.format(content_hash))
+        f.writelines(url_blocks)
+        f.write(SITEMAP_FOOTER)
+
 def generate_sitemap(models):
-    """Generate XML sitemap for SEO."""
+    """Generate XML sitemap for SEO, sharded behind a sitemap index when large."""
     print("Generating sitemap...")
     
-    # Get the repository name from environment or use default
-    repo_name = os.getenv('GITHUB_REPOSITORY', 'username/gguf-models').split('/')[-1]
-    base_url = f"https://{os.getenv('GITHUB_REPOSITORY_OWNER', 'username')}.github.io/{repo_name}"
+    # Hash everything the sitemap is derived from except the date, and
+    # collect the families (deduplicated in first-seen order) in the same
+    # pass over the models
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{URL_PREFIX}{URL_SUFFIX_TMPL}\0{BASE_URL}\0{MAX_URLS_PER_SITEMAP}\0'.encode('utf-8'))
+    families = {}
+    for model in models:
+        digest.update(f"{model['id']}\0".encode('utf-8'))
+        families[model.get('family', 'unknown')] = None
+    digest.update('\0'.join(families).encode('utf-8'))
+    content_hash = digest.hexdigest()
+    
+    url_count = 2 + len(models) + len(families)
+    shard_count = 0 if url_count <= MAX_URLS_PER_SITEMAP else -(-url_count // MAX_URLS_PER_SITEMAP)
     
-    sitemap_content = ['<?xml version="1.0" encoding="UTF-8"?>']
-    sitemap_content.append('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+    # Leave the published files (and their mtimes) alone when only the date
+    # would change and every file the sitemap is made of is still in place
+    expected = ['sitemap.xml.gz']
+    for shard in range(1, shard_count + 1):
+        expected += [f'sitemap-{shard}.xml', f'sitemap-{shard}.xml.gz']
+    if (_read_sitemap_hash('sitemap.xml') == content_hash
+            and all(Path(name).exists() for name in expected)):
+        print("Sitemap content unchanged, skipping write")
+        return
     
     current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    url_blocks = _iter_url_blocks(models, families, current_date)
     
-    # Add main page
-    sitemap_content.extend([
-        '  <url>',
-        f'    <loc>{base_url}/</loc>',
-        f'    <lastmod>{current_date}</lastmod>',
-        '    <changefreq>daily</changefreq>',
-        '    <priority>1.0</priority>',
-        '  </url>'
-    ])
-    
-    # Add search page
-    sitemap_content.extend([
-        '  <url>',
-        f'    <loc>{base_url}/search</loc>',
-        f'    <lastmod>{current_date}</lastmod>',
-        '    <changefreq>daily</changefreq>',
-        '    <priority>0.8</priority>',
-        '  </url>'
-    ])
-    
-    # Add model pages (limit to top 1000 for sitemap size)
-    for model in models[:1000]:
-        model_slug = model['id'].replace('/', '--').replace('_', '-')
-        sitemap_content.extend([
-            '  <url>',
-            f'    <loc>{base_url}/model/{model_slug}</loc>',
-            f'    <lastmod>{current_date}</lastmod>',
-            '    <changefreq>weekly</changefreq>',
-            '    <priority>0.6</priority>',
-            '  </url>'
-        ])
-    
-    # Add family pages
-    families = set(model.get('family', 'unknown') for model in models)
-    for family in sorted(families):
-        family_slug = family.replace('/', '--').replace('_', '-').lower()
-        sitemap_content.extend([
-            '  <url>',
-            f'    <loc>{base_url}/family/{family_slug}</loc>',
-            f'    <lastmod>{current_date}</lastmod>',
-            '    <changefreq>weekly</changefreq>',
-            '    <priority>0.5</priority>',
-            '  </url>'
-        ])
+    if not shard_count:
+        _write_urlset('sitemap.xml', url_blocks, content_hash)
+        _write_gzip_copy('sitemap.xml')
+    else:
+        # Split into numbered shards that stay under the 50,000 URL / 50 MB
+        # per-file limit, listed from a sitemap index at sitemap.xml. The
+        # index points crawlers at the plain shards, which are the files the
+        # workflow commits.
+        for shard in range(1, shard_count + 1):
+            _write_urlset(f'sitemap-{shard}.xml',
+                          islice(url_blocks, MAX_URLS_PER_SITEMAP), content_hash)
+            _write_gzip_copy(f'sitemap-{shard}.xml')
         
-    sitemap_content.append('</urlset>')
+        with _atomic_writer('sitemap.xml', 'w', encoding='utf-8') as f:
+            f.write(SITEMAP_INDEX_HEADER.format(content_hash))
+            f.writelines(
+                SITEMAP_INDEX_ENTRY_TMPL.format(escape(f'{BASE_URL}/sitemap-{shard}.xml'), current_date)
+                for shard in range(1, shard_count + 1)
+            )
+            f.write(SITEMAP_INDEX_FOOTER)
+        _write_gzip_copy('sitemap.xml')
     
-    with open('sitemap.xml', 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sitemap_content))
-        
-    print(f"Generated sitemap with {len(sitemap_content) - 2} URLs")
+    # Remove shards left behind by a previous, larger catalog
+    for path in Path('.').glob('sitemap-*.xml*'):
+        match = _SHARD_NAME_RE.fullmatch(path.name)
+        if match and int(match.group(1)) > shard_count:
+            path.unlink()
+    
+    if shard_count:
+        print(f"Generated sitemap index with {shard_count} shards and {url_count} URLs")
+    else:
+        print(f"Generated sitemap with {url_count} URLs")
 
 def generate_robots_txt():
     """Generate robots.txt file."""
     print("Generating robots.txt...")
     
-    repo_name = os.getenv('GITHUB_REPOSITORY', 'username/gguf-models').split('/')[-1]
-    base_url = f"https://{os.getenv('GITHUB_REPOSITORY_OWNER', 'username')}.github.io/{repo_name}"
-    
-    robots_content = [
-        '# Robots.txt for GGUF Models Discovery Website',
-        '# Generated automatically by data pipeline',
-        '',
-        'User-agent: *',
-        'Allow: /',
-        'Crawl-delay: 1',
-        '',
-        '# Sitemaps',
-        f'Sitemap: {base_url}/sitemap.xml',
-        '',
-        '# Disallow crawling of API endpoints',
-        'Disallow: /api/',
-        'Disallow: /_next/',
-        'Disallow: /admin/',
-        '',
-        '# Allow crawling of data files',
-        'Allow: /data/',
-        'Allow: /*.json',
-        'Allow: /*.xml'
-    ]
+    content = ROBOTS_TMPL.format(sitemap=f'{BASE_URL}/sitemap.xml')
+    try:
+        with open('robots.txt', 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                print("robots.txt unchanged, skipping write")
+                return
+    except OSError:
+        pass
     
-    with open('robots.txt', 'w', encoding='utf-8') as f:
-        f.write('\n'.join(robots_content))
+    with _atomic_writer('robots.txt', 'w', encoding='utf-8') as f:
+        f.write(content)
         
     print("Generated robots.txt")
 
@@ -156,9 +330,12 @@ def main():
     models = load_existing_models()
     print(f"Loaded {len(models)} models")
     
-    # Generate SEO files
-    generate_sitemap(models)
-    generate_robots_txt()
+    # Generate SEO files; they share no state, so write them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sitemap_future = executor.submit(generate_sitemap, models)
+        robots_future = executor.submit(generate_robots_txt)
+        sitemap_future.result()
+        robots_future.result()
     
     print("SEO files generation completed!")
 
@@ -7,21 +7,63 @@ Hugging Face statistics, monitoring, and alerting capabilities.
 """
 
 import asyncio
+import contextlib
+import hashlib
 import json
 import logging
+import random
 import time
+from array import array
+from collections import OrderedDict, namedtuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple
 from enum import Enum
+from itertools import compress, filterfalse
 
 import aiohttp
-import aiofiles
 from huggingface_hub import HfApi
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+HF_API_BASE_URL = "https://huggingface.co"
+HF_MODELS_PAGE_SIZE = 1000
+
+# Placeholder for timestamps that have not been recorded yet
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+ModelPage = namedtuple('ModelPage', ['items', 'next_url', 'total'])
+
+class _TTLCache:
+    """Bounded LRU mapping whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[str, Tuple[Any, float]]' = OrderedDict()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        if item[1] <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return item[0]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
 class CompletenessStatus(Enum):
     """Status of completeness verification."""
     EXCELLENT = "excellent"  # >= 98%
@@ -36,6 +78,42 @@ class AlertSeverity(Enum):
     CRITICAL = "critical"
     EMERGENCY = "emergency"
 
+_SEVERITY_EMOJI: Dict[AlertSeverity, str] = {
+    AlertSeverity.INFO: "ℹ️",
+    AlertSeverity.WARNING: "⚠️",
+    AlertSeverity.CRITICAL: "🚨",
+    AlertSeverity.EMERGENCY: "🆘"
+}
+_SEVERITY_LABEL: Dict[AlertSeverity, str] = {severity: severity.value.upper() for severity in AlertSeverity}
+
+AlertThresholds = namedtuple(
+    'AlertThresholds', ['critical_completeness', 'warning_completeness', 'missing_models_threshold']
+)
+
+def _make_status_classifier(excellent: float, good: float, warning: float):
+    """Build a score -> CompletenessStatus function with the thresholds bound as locals."""
+    def determine_status(score: float,
+                         _EXCELLENT=CompletenessStatus.EXCELLENT, _GOOD=CompletenessStatus.GOOD,
+                         _WARNING=CompletenessStatus.WARNING,
+                         _CRITICAL=CompletenessStatus.CRITICAL) -> CompletenessStatus:
+        if score >= excellent:
+            return _EXCELLENT
+        if score >= good:
+            return _GOOD
+        if score >= warning:
+            return _WARNING
+        return _CRITICAL
+    
+    return determine_status
+
+def _to_json_value(value: Any) -> Any:
+    """Convert enum and datetime values to their JSON representation."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
 @dataclass
 class CompletenessMetrics:
     """Metrics for data completeness verification."""
@@ -48,7 +126,7 @@ class CompletenessMetrics:
     missing_models: List[str] = field(default_factory=list)
     failed_models: List[str] = field(default_factory=list)
     verification_time: float = 0.0
-    last_verification: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_verification: datetime = _EPOCH  # stamped when a verification completes
     
     # Quality metrics
     models_with_complete_data: int = 0
@@ -58,6 +136,10 @@ class CompletenessMetrics:
     # Discovery strategy metrics
     discovery_coverage: Dict[str, int] = field(default_factory=dict)
     strategy_effectiveness: Dict[str, float] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow, JSON-ready dictionary of all fields."""
+        return {name: _to_json_value(getattr(self, name)) for name in self.__dataclass_fields__}
 
 @dataclass
 class MissingModelInfo:
@@ -67,6 +149,75 @@ class MissingModelInfo:
     last_seen: Optional[datetime] = None
     recovery_attempts: int = 0
     recovery_status: str = "pending"
+    # Listing entry (with siblings) captured during detection, if any
+    model_info: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow, JSON-ready dictionary of all fields."""
+        return {name: _to_json_value(getattr(self, name)) for name in self.__dataclass_fields__}
+
+class MissingModelTable:
+    """Column-oriented store of missing models for bulk recovery.
+    
+    Each field of MissingModelInfo is kept as its own column, with the
+    attempt counters in a packed array, so selecting the rows that are
+    still eligible for recovery is a single scan of one column.
+    """
+    
+    def __init__(self):
+        self.model_ids: List[str] = []
+        self.expected_source: List[str] = []
+        self.last_seen: List[Optional[datetime]] = []
+        self.recovery_attempts = array('H')
+        self.recovery_status: List[str] = []
+        self.model_info: List[Optional[Dict[str, Any]]] = []
+        self._index: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self.model_ids)
+    
+    def __contains__(self, model_id: str) -> bool:
+        return model_id in self._index
+    
+    def upsert(self, model_id: str, expected_source: str,
+               last_seen: Optional[datetime] = None,
+               model_info: Optional[Dict[str, Any]] = None) -> int:
+        """Add a missing model, or refresh it while keeping its recovery history."""
+        idx = self._index.get(model_id)
+        if idx is None:
+            idx = self._index[model_id] = len(self.model_ids)
+            self.model_ids.append(model_id)
+            self.expected_source.append(expected_source)
+            self.last_seen.append(last_seen)
+            self.recovery_attempts.append(0)
+            self.recovery_status.append("pending")
+            self.model_info.append(model_info)
+        else:
+            self.last_seen[idx] = last_seen
+            self.model_info[idx] = model_info
+        return idx
+    
+    def ready(self, max_attempts: int) -> List[int]:
+        """Indices of models with fewer than ``max_attempts`` recovery attempts."""
+        return list(compress(range(len(self.recovery_attempts)),
+                             map(max_attempts.__gt__, self.recovery_attempts)))
+    
+    def update(self, idx: int, status: str, attempts: Optional[int] = None) -> None:
+        """Record the outcome of a recovery attempt."""
+        self.recovery_status[idx] = status
+        if attempts is not None:
+            self.recovery_attempts[idx] = attempts
+    
+    def row(self, idx: int) -> MissingModelInfo:
+        """Materialise one row as a MissingModelInfo."""
+        return MissingModelInfo(
+            model_id=self.model_ids[idx],
+            expected_source=self.expected_source[idx],
+            last_seen=self.last_seen[idx],
+            recovery_attempts=self.recovery_attempts[idx],
+            recovery_status=self.recovery_status[idx],
+            model_info=self.model_info[idx]
+        )
 
 @dataclass
 class CompletenessAlert:
@@ -77,115 +228,343 @@ class CompletenessAlert:
     timestamp: datetime
     metrics: Dict[str, Any] = field(default_factory=dict)
     suggested_actions: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow, JSON-ready dictionary of all fields."""
+        return {name: _to_json_value(getattr(self, name)) for name in self.__dataclass_fields__}
+
+ModelColumns = namedtuple('ModelColumns', ['ids', 'has_files', 'scores', 'accessible'])
+
+def _extract_columns(processed_models: List[Dict[str, Any]]) -> ModelColumns:
+    """Read every per-model field verification needs in one pass over the models."""
+    columns = ModelColumns([], array('b'), array('d'), array('b'))
+    add_id, add_has_files = columns.ids.append, columns.has_files.append
+    add_score, add_accessible = columns.scores.append, columns.accessible.append
+    
+    for model in processed_models:
+        validation_info = model.get('_validation', {})
+        add_id(model.get('id', ''))
+        add_has_files(bool(model.get('files', [])))
+        add_score(validation_info.get('completeness_score', 0.0))
+        add_accessible(bool(validation_info.get('file_accessibility', {}).get('all_accessible', False)))
+    
+    return columns
+
+def _verification_digest(columns: ModelColumns,
+                         discovery_results: Optional[Dict[str, Any]] = None) -> bytes:
+    """Digest of every input that feeds a completeness report."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\0'.join(columns.ids).encode('utf-8', 'surrogatepass'))
+    digest.update(columns.has_files.tobytes())
+    digest.update(columns.scores.tobytes())
+    digest.update(columns.accessible.tobytes())
+    
+    # Discovery coverage only depends on each strategy's outcome and size
+    for result in (discovery_results or {}).get('strategy_results', []):
+        digest.update(
+            f"\0{result.get('strategy', 'unknown')}\0{len(result.get('models', []))}"
+            f"\0{result.get('success', False)}".encode('utf-8', 'surrogatepass')
+        )
+    return digest.digest()
+
+def _quality_stats(scores: array, accessible: array, threshold: float) -> Tuple[float, int, int]:
+    """Reduce the quality columns to (score total, scores >= threshold, accessible count).
+    
+    Each reduction is a single builtin call, so the per-element loop runs in C.
+    """
+    return sum(scores), sum(map(threshold.__le__, scores)), accessible.count(1)
+
+def _parse_hf_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp returned by the Hugging Face API."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+def _is_gguf_filename(name: str) -> bool:
+    """Check whether a repository file name has the .gguf extension."""
+    # Lowercase names match without allocating; otherwise only the
+    # 5-character tail is lowered, not the whole path
+    return name.endswith('.gguf') or name[-5:].lower() == '.gguf'
+
+def has_gguf_files(model_info: Dict[str, Any]) -> bool:
+    """Check whether a Hub model payload lists any GGUF files."""
+    return any(_is_gguf_filename(file_info.get('rfilename', ''))
+               for file_info in model_info.get('siblings') or [])
+
+def gguf_filenames(model_info: Dict[str, Any]) -> List[str]:
+    """Names of the GGUF files listed in a Hub model payload."""
+    return [file_info['rfilename'] for file_info in model_info.get('siblings') or []
+            if _is_gguf_filename(file_info.get('rfilename', ''))]
+
+class HuggingFaceAPIClient:
+    """Async client for the Hugging Face Hub JSON API.
+    
+    Uses one long-lived aiohttp session so requests reuse pooled keep-alive
+    connections and never block the event loop the way the synchronous
+    HfApi calls do. A single instance is meant to be shared by every
+    component that talks to the Hub so they draw from the same pool.
+    """
+    
+    def __init__(self, rate_limiter, token: Optional[str] = None,
+                 base_url: str = HF_API_BASE_URL, max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.rate_limiter = rate_limiter
+        self.token = token
+        self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            headers = {'User-Agent': 'GGUF-Model-Discovery/1.0'}
+            if self.token:
+                headers['Authorization'] = f'Bearer {self.token}'
+            
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+                headers=headers
+            )
+        return self._session
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Delay before retrying a rate-limited request."""
+        if retry_after:
+            try:
+                return min(self.backoff_max, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        # Jitter keeps concurrent requests from retrying in lockstep
+        return delay + random.uniform(0, delay * 0.1)
+    
+    async def _get_json(self, url: str,
+                        params: Optional[Dict[str, Any]] = None) -> Tuple[Any, aiohttp.ClientResponse]:
+        """GET a JSON payload, backing off exponentially on HTTP 429.
+        
+        The error is raised inside the rate limiter context so an adaptive
+        limiter can slow down as well.
+        """
+        session = self._get_session()
+        attempt = 0
+        while True:
+            try:
+                async with self.rate_limiter:
+                    async with session.get(url, params=params) as response:
+                        response.raise_for_status()
+                        return await response.json(), response
+            except aiohttp.ClientResponseError as e:
+                if e.status != 429 or attempt >= self.max_retries:
+                    raise
+                retry_after = e.headers.get('Retry-After') if e.headers else None
+            
+            delay = self._backoff_delay(attempt, retry_after)
+            logger.debug("Rate limited by Hugging Face, retrying in %.1fs: %s", delay, url)
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def get_model_page(self, url: Optional[str] = None, **params) -> ModelPage:
+        """Fetch one page of /api/models results.
+        
+        ``total`` is the X-Total-Count header, if the server sent one.
+        """
+        if url is None:
+            url = f"{self.base_url}/api/models"
+            params = {'limit': HF_MODELS_PAGE_SIZE, **params}
+        
+        page, response = await self._get_json(url, params or None)
+        next_link = response.links.get('next')
+        
+        # The next link already carries the query string and cursor
+        next_url = str(next_link['url']) if next_link else None
+        
+        total = response.headers.get('X-Total-Count')
+        return ModelPage(
+            items=page,
+            next_url=next_url,
+            total=int(total) if total and total.isdigit() else None
+        )
+    
+    async def iter_model_pages(self, url: Optional[str] = None, prefetch: int = 2,
+                               max_pages: Optional[int] = None,
+                               **params) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of /api/models results, following the Link header cursor.
+        
+        A background producer fetches up to ``prefetch`` pages ahead through a
+        bounded queue, so the next request is in flight while the caller
+        processes the current page. Iteration starts at ``url`` if given and
+        stops after ``max_pages`` pages.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+        
+        async def produce() -> None:
+            next_url = url
+            pages = 1
+            try:
+                page = await self.get_model_page(next_url, **params)
+                await queue.put(page.items)
+                while page.next_url and (max_pages is None or pages < max_pages):
+                    pages += 1
+                    page = await self.get_model_page(page.next_url)
+                    await queue.put(page.items)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while (page := await queue.get()) is not None:
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            # Stop fetching if the caller broke out early, and wait for the
+            # producer to finish so no request outlives the iteration
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+    
+    async def model_info(self, model_id: str) -> Dict[str, Any]:
+        """Fetch the metadata of a single model."""
+        model_info, _ = await self._get_json(f"{self.base_url}/api/models/{model_id}")
+        return model_info
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
 class HuggingFaceStatsCollector:
     """Collects statistics from Hugging Face for comparison."""
     
-    def __init__(self, api: HfApi, rate_limiter):
-        self.api = api
-        self.rate_limiter = rate_limiter
-        self.stats_cache: Dict[str, Tuple[Any, datetime]] = {}
+    def __init__(self, http_client: HuggingFaceAPIClient, max_concurrency: int = 10):
+        self.http_client = http_client
+        self.max_concurrency = max_concurrency
         self.cache_duration = 3600  # 1 hour cache
+        self.stats_cache = _TTLCache(maxsize=4096, ttl=self.cache_duration)
+        
+        # Last known count, kept past cache expiry as a stale fallback
+        self._last_count: Optional[int] = None
     
     async def get_total_gguf_models_count(self) -> int:
         """Get the total count of models with GGUF files from Hugging Face."""
         cache_key = "total_gguf_count"
         
         # Check cache first
-        if cache_key in self.stats_cache:
-            count, cached_time = self.stats_cache[cache_key]
-            if (datetime.now(timezone.utc) - cached_time).total_seconds() < self.cache_duration:
-                logger.debug(f"Using cached GGUF count: {count}")
-                return count
+        count = self.stats_cache.get(cache_key)
+        if count is not None:
+            logger.debug("Using cached GGUF count: %d", count)
+            return count
         
         try:
             logger.info("🔍 Fetching total GGUF models count from Hugging Face...")
             
-            async with self.rate_limiter:
-                # Use the API to count models with GGUF filter
-                models = list(self.api.list_models(
-                    filter="gguf",
-                    limit=None,  # Get all models to count them
-                    sort="downloads",
-                    direction=-1
-                ))
+            # A one-item request is enough when the server reports the total
+            listing = dict(filter="gguf", sort="downloads", direction=-1)
+            probe = await self.http_client.get_model_page(limit=1, **listing)
             
-            count = len(models)
+            if probe.total is not None:
+                count = probe.total
+            else:
+                # No total header: count page by page, holding only a few pages at a time
+                count = 0
+                async for page in self.http_client.iter_model_pages(**listing):
+                    count += len(page)
+            self._last_count = count
             
             # Cache the result
-            self.stats_cache[cache_key] = (count, datetime.now(timezone.utc))
+            self.stats_cache[cache_key] = count
             
-            logger.info(f"📊 Total GGUF models on Hugging Face: {count}")
+            logger.info("📊 Total GGUF models on Hugging Face: %d", count)
             return count
             
         except Exception as e:
-            logger.error(f"❌ Failed to fetch GGUF models count: {e}")
+            logger.error("❌ Failed to fetch GGUF models count: %s", e)
             # Return cached value if available, otherwise return 0
-            if cache_key in self.stats_cache:
-                count, _ = self.stats_cache[cache_key]
-                logger.warning(f"⚠️ Using stale cached count: {count}")
-                return count
+            if self._last_count is not None:
+                logger.warning("⚠️ Using stale cached count: %d", self._last_count)
+                return self._last_count
             return 0
     
     async def get_model_statistics(self, model_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """Get detailed statistics for specific models."""
-        stats = {}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        for model_id in model_ids[:10]:  # Limit to avoid rate limiting
-            try:
-                async with self.rate_limiter:
-                    model_info = self.api.model_info(model_id)
-                    
-                stats[model_id] = {
-                    'downloads': getattr(model_info, 'downloads', 0),
-                    'likes': getattr(model_info, 'likes', 0),
-                    'tags': getattr(model_info, 'tags', []),
-                    'last_modified': getattr(model_info, 'lastModified', None),
-                    'created_at': getattr(model_info, 'createdAt', None)
-                }
-                
-                # Small delay to avoid overwhelming the API
-                await asyncio.sleep(0.1)
-                
-            except Exception as e:
-                logger.debug(f"Could not fetch stats for {model_id}: {e}")
-                stats[model_id] = {}
+        async def fetch_stats(model_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    model_info = await self.http_client.model_info(model_id)
+                except Exception as e:
+                    logger.debug("Could not fetch stats for %s: %s", model_id, e)
+                    return {}
+            
+            return {
+                'downloads': model_info.get('downloads', 0),
+                'likes': model_info.get('likes', 0),
+                'tags': model_info.get('tags', []),
+                'last_modified': model_info.get('lastModified'),
+                'created_at': model_info.get('createdAt')
+            }
         
-        return stats
+        model_ids = model_ids[:10]  # Limit to avoid rate limiting
+        results = await asyncio.gather(*(fetch_stats(model_id) for model_id in model_ids))
+        return dict(zip(model_ids, results))
 
 class CompletenessVerifier:
     """Verifies data completeness against Hugging Face statistics."""
     
-    def __init__(self, api: HfApi, rate_limiter, config: Dict[str, Any] = None):
+    def __init__(self, api: HfApi, rate_limiter, config: Dict[str, Any] = None,
+                 http_client: Optional[HuggingFaceAPIClient] = None):
         self.api = api
         self.rate_limiter = rate_limiter
         self.config = config or {}
-        self.stats_collector = HuggingFaceStatsCollector(api, rate_limiter)
+        self.http_client = http_client or HuggingFaceAPIClient(
+            rate_limiter, token=getattr(api, 'token', None)
+        )
+        self.stats_collector = HuggingFaceStatsCollector(self.http_client)
         self.metrics = CompletenessMetrics()
-        self.missing_models: Dict[str, MissingModelInfo] = {}
+        self.missing_models = MissingModelTable()
         
         # Configuration
         self.min_completeness_threshold = self.config.get('min_completeness_threshold', 95.0)
         self.warning_threshold = self.config.get('warning_threshold', 90.0)
         self.excellent_threshold = self.config.get('excellent_threshold', 98.0)
+        self.missing_scan_max_pages = self.config.get('missing_scan_max_pages', 1)
+        self._determine_completeness_status = _make_status_classifier(
+            self.excellent_threshold, self.min_completeness_threshold, self.warning_threshold
+        )
     
     async def verify_completeness(self, processed_models: List[Dict[str, Any]], 
-                                discovery_results: Optional[Dict[str, Any]] = None) -> CompletenessMetrics:
-        """Perform comprehensive completeness verification."""
+                                discovery_results: Optional[Dict[str, Any]] = None,
+                                columns: Optional[ModelColumns] = None) -> CompletenessMetrics:
+        """Perform comprehensive completeness verification.
+        
+        ``columns`` may carry an already extracted view of ``processed_models``.
+        """
         start_time = time.time()
         logger.info("🔍 Starting data completeness verification...")
         
         # Reset metrics
         self.metrics = CompletenessMetrics()
         self.metrics.total_models_processed = len(processed_models)
+        if columns is None:
+            columns = _extract_columns(processed_models)
         
         # Get Hugging Face statistics
         hf_gguf_count = await self.stats_collector.get_total_gguf_models_count()
         self.metrics.huggingface_gguf_count = hf_gguf_count
         
         # Count models with GGUF files
-        models_with_gguf = [m for m in processed_models if m.get('files', [])]
-        self.metrics.total_models_with_gguf = len(models_with_gguf)
+        self.metrics.total_models_with_gguf = columns.has_files.count(1)
         
         # Calculate basic completeness score
         if hf_gguf_count > 0:
@@ -203,30 +582,20 @@ class CompletenessVerifier:
             await self._analyze_discovery_coverage(discovery_results)
         
         # Analyze model quality and completeness
-        await self._analyze_model_quality(processed_models)
+        await self._analyze_model_quality(columns)
         
         # Detect missing models
-        await self._detect_missing_models(processed_models, hf_gguf_count)
+        await self._detect_missing_models(columns.ids, hf_gguf_count)
         
-        self.metrics.verification_time = time.time() - start_time
-        self.metrics.last_verification = datetime.now(timezone.utc)
+        end_time = time.time()
+        self.metrics.verification_time = end_time - start_time
+        self.metrics.last_verification = datetime.fromtimestamp(end_time, timezone.utc)
         
         # Log verification results
         self._log_verification_results()
         
         return self.metrics
     
-    def _determine_completeness_status(self, score: float) -> CompletenessStatus:
-        """Determine completeness status based on score."""
-        if score >= self.excellent_threshold:
-            return CompletenessStatus.EXCELLENT
-        elif score >= self.min_completeness_threshold:
-            return CompletenessStatus.GOOD
-        elif score >= self.warning_threshold:
-            return CompletenessStatus.WARNING
-        else:
-            return CompletenessStatus.CRITICAL
-    
     async def _analyze_discovery_coverage(self, discovery_results: Dict[str, Any]) -> None:
         """Analyze the effectiveness of different discovery strategies."""
         logger.info("📊 Analyzing discovery strategy coverage...")
@@ -245,164 +614,198 @@ class CompletenessVerifier:
                 self.metrics.strategy_effectiveness[strategy_name] = effectiveness
         
         # Log strategy effectiveness
-        logger.info("🎯 Discovery strategy effectiveness:")
-        for strategy, effectiveness in self.metrics.strategy_effectiveness.items():
-            logger.info(f"   • {strategy}: {effectiveness:.1f}% coverage")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🎯 Discovery strategy effectiveness:")
+            for strategy, effectiveness in self.metrics.strategy_effectiveness.items():
+                logger.info("   • %s: %.1f%% coverage", strategy, effectiveness)
     
-    async def _analyze_model_quality(self, processed_models: List[Dict[str, Any]]) -> None:
+    async def _analyze_model_quality(self, columns: ModelColumns) -> None:
         """Analyze the quality and completeness of processed models."""
         logger.info("🔍 Analyzing model data quality...")
         
-        complete_models = 0
-        accessible_models = 0
-        total_completeness = 0.0
-        
-        for model in processed_models:
-            # Check data completeness
-            validation_info = model.get('_validation', {})
-            model_completeness = validation_info.get('completeness_score', 0.0)
-            total_completeness += model_completeness
-            
-            if model_completeness >= 80.0:  # Consider 80%+ as complete
-                complete_models += 1
-            
-            # Check file accessibility
-            if validation_info.get('file_accessibility', {}).get('all_accessible', False):
-                accessible_models += 1
+        total_completeness, complete_models, accessible_models = _quality_stats(
+            columns.scores, columns.accessible, 80.0  # Consider 80%+ as complete
+        )
         
         self.metrics.models_with_complete_data = complete_models
         self.metrics.models_with_accessible_files = accessible_models
         
-        if processed_models:
-            self.metrics.average_model_completeness = total_completeness / len(processed_models)
+        total = len(columns.scores)
+        if total:
+            self.metrics.average_model_completeness = total_completeness / total
         
-        logger.info(f"📊 Model quality analysis:")
-        logger.info(f"   • Complete data: {complete_models}/{len(processed_models)} ({complete_models/len(processed_models)*100:.1f}%)")
-        logger.info(f"   • Accessible files: {accessible_models}/{len(processed_models)} ({accessible_models/len(processed_models)*100:.1f}%)")
-        logger.info(f"   • Average completeness: {self.metrics.average_model_completeness:.1f}%")
+        if total and logger.isEnabledFor(logging.INFO):
+            logger.info("📊 Model quality analysis:")
+            logger.info("   • Complete data: %d/%d (%.1f%%)", complete_models, total, complete_models / total * 100)
+            logger.info("   • Accessible files: %d/%d (%.1f%%)", accessible_models, total, accessible_models / total * 100)
+            logger.info("   • Average completeness: %.1f%%", self.metrics.average_model_completeness)
     
-    async def _detect_missing_models(self, processed_models: List[Dict[str, Any]], 
-                                   expected_count: int) -> None:
-        """Detect potentially missing models."""
+    async def _detect_missing_models(self, processed_ids: List[str], 
+                                   expected_count: int, max_pages: Optional[int] = None) -> None:
+        """Detect potentially missing models.
+        
+        Crawls up to ``max_pages`` pages of recently modified GGUF models with
+        their file listings inline, so each missing model is confirmed to
+        actually ship GGUF files without a separate model_info request.
+        """
         logger.info("🔍 Detecting missing models...")
         
-        processed_ids = {model.get('id', '') for model in processed_models}
-        missing_count = max(0, expected_count - len(processed_models))
+        missing_count = max(0, expected_count - len(processed_ids))
+        if max_pages is None:
+            max_pages = self.missing_scan_max_pages
         
         if missing_count > 0:
-            logger.warning(f"⚠️ Potentially missing {missing_count} models")
+            logger.warning("⚠️ Potentially missing %d models", missing_count)
             
-            # Try to identify specific missing models by sampling from HF
+            # Try to identify specific missing models by scanning recent HF models
+            processed = set(processed_ids)
             try:
-                # Get a sample of recent models from HF to identify missing ones
-                async with self.rate_limiter:
-                    recent_models = list(self.api.list_models(
-                        filter="gguf",
-                        limit=100,  # Sample recent models
-                        sort="lastModified",
-                        direction=-1
-                    ))
-                
-                for model in recent_models:
-                    if model.id not in processed_ids:
-                        missing_info = MissingModelInfo(
-                            model_id=model.id,
-                            expected_source="huggingface_recent",
-                            last_seen=getattr(model, 'lastModified', None)
+                async for page in self.http_client.iter_model_pages(
+                    max_pages=max_pages,
+                    filter="gguf",
+                    sort="lastModified",
+                    direction=-1,
+                    full="true",
+                    config="false"
+                ):
+                    # Diff the page against the processed ids at C level;
+                    # only unseen models reach the Python loop body
+                    page_by_id = {model.get('id', ''): model for model in page}
+                    for model_id in filterfalse(processed.__contains__, page_by_id):
+                        model = page_by_id[model_id]
+                        if not model_id or not has_gguf_files(model):
+                            continue
+                        
+                        # Keeps the recovery history of models already known to be missing
+                        self.missing_models.upsert(
+                            model_id, "huggingface_recent",
+                            last_seen=_parse_hf_timestamp(model.get('lastModified')),
+                            model_info=model
                         )
-                        self.missing_models[model.id] = missing_info
-                        self.metrics.missing_models.append(model.id)
+                        self.metrics.missing_models.append(model_id)
                 
-                logger.info(f"🔍 Identified {len(self.metrics.missing_models)} specific missing models")
+                logger.info("🔍 Identified %d specific missing models", len(self.metrics.missing_models))
                 
             except Exception as e:
-                logger.warning(f"⚠️ Could not identify specific missing models: {e}")
+                logger.warning("⚠️ Could not identify specific missing models: %s", e)
     
     def _log_verification_results(self) -> None:
         """Log comprehensive verification results."""
-        logger.info("📊 === COMPLETENESS VERIFICATION RESULTS ===")
-        logger.info(f"🎯 Completeness Score: {self.metrics.completeness_score:.2f}%")
-        logger.info(f"📈 Status: {self.metrics.completeness_status.value.upper()}")
-        logger.info(f"📊 Models Processed: {self.metrics.total_models_processed}")
-        logger.info(f"🔍 Models with GGUF: {self.metrics.total_models_with_gguf}")
-        logger.info(f"🌐 HuggingFace GGUF Count: {self.metrics.huggingface_gguf_count}")
-        
-        if self.metrics.missing_models:
-            logger.warning(f"⚠️ Missing Models: {len(self.metrics.missing_models)}")
-            logger.debug(f"   Examples: {self.metrics.missing_models[:5]}")
-        
-        logger.info(f"✅ Complete Data: {self.metrics.models_with_complete_data}/{self.metrics.total_models_processed}")
-        logger.info(f"🔗 Accessible Files: {self.metrics.models_with_accessible_files}/{self.metrics.total_models_processed}")
-        logger.info(f"⏱️ Verification Time: {self.metrics.verification_time:.1f}s")
-        logger.info("=" * 50)
+        metrics = self.metrics
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        
+        if info_enabled:
+            logger.info("📊 === COMPLETENESS VERIFICATION RESULTS ===")
+            logger.info("🎯 Completeness Score: %.2f%%", metrics.completeness_score)
+            logger.info("📈 Status: %s", metrics.completeness_status.value.upper())
+            logger.info("📊 Models Processed: %d", metrics.total_models_processed)
+            logger.info("🔍 Models with GGUF: %d", metrics.total_models_with_gguf)
+            logger.info("🌐 HuggingFace GGUF Count: %d", metrics.huggingface_gguf_count)
+        
+        if metrics.missing_models:
+            logger.warning("⚠️ Missing Models: %d", len(metrics.missing_models))
+            logger.debug("   Examples: %s", metrics.missing_models[:5])
+        
+        if info_enabled:
+            logger.info("✅ Complete Data: %d/%d", metrics.models_with_complete_data, metrics.total_models_processed)
+            logger.info("🔗 Accessible Files: %d/%d", metrics.models_with_accessible_files, metrics.total_models_processed)
+            logger.info("⏱️ Verification Time: %.1fs", metrics.verification_time)
+            logger.info("=" * 50)
 
 class MissingModelRecovery:
     """Handles recovery of missing models."""
     
-    def __init__(self, api: HfApi, rate_limiter):
+    def __init__(self, api: HfApi, rate_limiter,
+                 http_client: Optional[HuggingFaceAPIClient] = None,
+                 max_concurrency: int = 16):
         self.api = api
         self.rate_limiter = rate_limiter
+        self.http_client = http_client or HuggingFaceAPIClient(
+            rate_limiter, token=getattr(api, 'token', None)
+        )
         self.recovery_attempts: Dict[str, int] = {}
         self.max_recovery_attempts = 3
+        self.max_concurrency = max_concurrency
     
-    async def attempt_recovery(self, missing_models: Dict[str, MissingModelInfo]) -> Dict[str, Any]:
+    async def attempt_recovery(self, missing_models: MissingModelTable) -> Dict[str, Any]:
         """Attempt to recover missing models."""
-        logger.info(f"🔄 Attempting recovery of {len(missing_models)} missing models...")
+        logger.info("🔄 Attempting recovery of %d missing models...", len(missing_models))
         
-        recovered_models = []
-        failed_recoveries = []
+        ready = missing_models.ready(self.max_recovery_attempts)
+        skipped = len(missing_models) - len(ready)
+        if skipped:
+            logger.debug("⏭️ Skipping %d models - max recovery attempts reached", skipped)
         
-        for model_id, missing_info in missing_models.items():
-            if missing_info.recovery_attempts >= self.max_recovery_attempts:
-                logger.debug(f"⏭️ Skipping {model_id} - max recovery attempts reached")
-                continue
-            
+        # Fetch all candidates concurrently; the semaphore bounds in-flight
+        # requests and the shared rate limiter keeps us within API limits
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._recover_one(missing_models, idx, semaphore) for idx in ready)
+        )
+        
+        recovered_models = [recovered for recovered, _ in results if recovered is not None]
+        failed_recoveries = [failed for _, failed in results if failed is not None]
+        
+        logger.info("✅ Recovery complete: %d recovered, %d failed",
+                    len(recovered_models), len(failed_recoveries))
+        
+        return {
+            'recovered_models': recovered_models,
+            'failed_recoveries': failed_recoveries,
+            'recovery_rate': len(recovered_models) / len(missing_models) * 100 if missing_models else 0
+        }
+    
+    async def _recover_one(self, missing_models: MissingModelTable, idx: int,
+                           semaphore: asyncio.Semaphore) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Try to recover the model in row ``idx`` of the table.
+        
+        Returns a ``(recovered_model, failed_model_id)`` pair where at most
+        one side is set.
+        """
+        model_id = missing_models.model_ids[idx]
+        attempts = missing_models.recovery_attempts[idx]
+        
+        async with semaphore:
             try:
-                logger.info(f"🔄 Attempting recovery of {model_id}...")
+                # Detection already confirmed GGUF files from the listing, so
+                # no extra round trip is needed for those models
+                listed_info = missing_models.model_info[idx]
+                if listed_info is not None:
+                    missing_models.update(idx, "recovered", attempts + 1)
+                    logger.info("✅ Recovered %s from discovery listing", model_id)
+                    return {
+                        'id': model_id,
+                        'recovery_method': 'discovery_listing',
+                        'gguf_files': gguf_filenames(listed_info)
+                    }, None
                 
-                async with self.rate_limiter:
-                    model_info = self.api.model_info(model_id)
+                logger.info("🔄 Attempting recovery of %s...", model_id)
+                
+                model_info = await self.http_client.model_info(model_id)
                 
                 # Check if model actually has GGUF files
                 if self._has_gguf_files(model_info):
-                    recovered_models.append({
+                    missing_models.update(idx, "recovered", attempts + 1)
+                    logger.info("✅ Successfully recovered %s", model_id)
+                    return {
                         'id': model_id,
                         'recovery_method': 'direct_fetch',
-                        'model_info': model_info
-                    })
-                    missing_info.recovery_status = "recovered"
-                    logger.info(f"✅ Successfully recovered {model_id}")
-                else:
-                    missing_info.recovery_status = "no_gguf_files"
-                    logger.debug(f"ℹ️ {model_id} exists but has no GGUF files")
+                        'gguf_files': gguf_filenames(model_info)
+                    }, None
                 
-                missing_info.recovery_attempts += 1
-                await asyncio.sleep(0.2)  # Rate limiting
+                missing_models.update(idx, "no_gguf_files", attempts + 1)
+                logger.debug("ℹ️ %s exists but has no GGUF files", model_id)
+                return None, None
                 
             except Exception as e:
-                missing_info.recovery_attempts += 1
-                missing_info.recovery_status = f"failed: {str(e)}"
-                failed_recoveries.append(model_id)
-                logger.debug(f"❌ Failed to recover {model_id}: {e}")
-        
-        logger.info(f"✅ Recovery complete: {len(recovered_models)} recovered, {len(failed_recoveries)} failed")
-        
-        return {
-            'recovered_models': recovered_models,
-            'failed_recoveries': failed_recoveries,
-            'recovery_rate': len(recovered_models) / len(missing_models) * 100 if missing_models else 0
-        }
+                missing_models.update(idx, f"failed: {str(e)}", attempts + 1)
+                logger.debug("❌ Failed to recover %s: %s", model_id, e)
+                return None, model_id
     
-    def _has_gguf_files(self, model_info) -> bool:
+    def _has_gguf_files(self, model_info: Dict[str, Any]) -> bool:
         """Check if a model has GGUF files."""
         try:
-            # Check model files for GGUF extensions
-            files = getattr(model_info, 'siblings', [])
-            for file_info in files:
-                filename = getattr(file_info, 'rfilename', '')
-                if filename.lower().endswith('.gguf'):
-                    return True
-            return False
+            return has_gguf_files(model_info)
         except Exception:
             return False
 
@@ -413,26 +816,29 @@ class CompletenessAlertSystem:
         self.config = config or {}
         self.alerts: List[CompletenessAlert] = []
         self.notification_channels = self.config.get('notification_channels', ['log'])
-        self.alert_thresholds = {
-            'critical_completeness': self.config.get('critical_threshold', 90.0),
-            'warning_completeness': self.config.get('warning_threshold', 95.0),
-            'missing_models_threshold': self.config.get('missing_models_threshold', 50)
-        }
+        self.alert_thresholds = AlertThresholds(
+            critical_completeness=self.config.get('critical_threshold', 90.0),
+            warning_completeness=self.config.get('warning_threshold', 95.0),
+            missing_models_threshold=self.config.get('missing_models_threshold', 50)
+        )
     
-    async def evaluate_and_alert(self, metrics: CompletenessMetrics) -> List[CompletenessAlert]:
+    async def evaluate_and_alert(self, metrics: CompletenessMetrics,
+                                 now: Optional[datetime] = None) -> List[CompletenessAlert]:
         """Evaluate metrics and generate alerts if necessary."""
         logger.info("🚨 Evaluating completeness metrics for alerts...")
         
         self.alerts.clear()
+        # All alerts from one evaluation share a single timestamp
+        now = now or datetime.now(timezone.utc)
         
         # Check completeness score
-        await self._check_completeness_score(metrics)
+        await self._check_completeness_score(metrics, now)
         
         # Check missing models
-        await self._check_missing_models(metrics)
+        await self._check_missing_models(metrics, now)
         
         # Check data quality
-        await self._check_data_quality(metrics)
+        await self._check_data_quality(metrics, now)
         
         # Send alerts
         if self.alerts:
@@ -442,19 +848,20 @@ class CompletenessAlertSystem:
         
         return self.alerts
     
-    async def _check_completeness_score(self, metrics: CompletenessMetrics) -> None:
+    async def _check_completeness_score(self, metrics: CompletenessMetrics, now: datetime) -> None:
         """Check completeness score and generate alerts."""
         score = metrics.completeness_score
+        critical, warning = self.alert_thresholds.critical_completeness, self.alert_thresholds.warning_completeness
         
-        if score < self.alert_thresholds['critical_completeness']:
+        if score < critical:
             alert = CompletenessAlert(
                 severity=AlertSeverity.CRITICAL,
                 title="Critical Data Completeness Issue",
-                message=f"Data completeness is critically low: {score:.2f}% (threshold: {self.alert_thresholds['critical_completeness']}%)",
-                timestamp=datetime.now(timezone.utc),
+                message=f"Data completeness is critically low: {score:.2f}% (threshold: {critical}%)",
+                timestamp=now,
                 metrics={
                     'completeness_score': score,
-                    'threshold': self.alert_thresholds['critical_completeness'],
+                    'threshold': critical,
                     'missing_count': metrics.huggingface_gguf_count - metrics.total_models_with_gguf
                 },
                 suggested_actions=[
@@ -466,15 +873,15 @@ class CompletenessAlertSystem:
             )
             self.alerts.append(alert)
             
-        elif score < self.alert_thresholds['warning_completeness']:
+        elif score < warning:
             alert = CompletenessAlert(
                 severity=AlertSeverity.WARNING,
                 title="Data Completeness Warning",
-                message=f"Data completeness below warning threshold: {score:.2f}% (threshold: {self.alert_thresholds['warning_completeness']}%)",
-                timestamp=datetime.now(timezone.utc),
+                message=f"Data completeness below warning threshold: {score:.2f}% (threshold: {warning}%)",
+                timestamp=now,
                 metrics={
                     'completeness_score': score,
-                    'threshold': self.alert_thresholds['warning_completeness']
+                    'threshold': warning
                 },
                 suggested_actions=[
                     "Monitor next sync cycle",
@@ -484,19 +891,20 @@ class CompletenessAlertSystem:
             )
             self.alerts.append(alert)
     
-    async def _check_missing_models(self, metrics: CompletenessMetrics) -> None:
+    async def _check_missing_models(self, metrics: CompletenessMetrics, now: datetime) -> None:
         """Check for missing models and generate alerts."""
         missing_count = len(metrics.missing_models)
+        threshold = self.alert_thresholds.missing_models_threshold
         
-        if missing_count >= self.alert_thresholds['missing_models_threshold']:
+        if missing_count >= threshold:
             alert = CompletenessAlert(
                 severity=AlertSeverity.WARNING,
                 title="High Number of Missing Models",
-                message=f"Detected {missing_count} missing models (threshold: {self.alert_thresholds['missing_models_threshold']})",
-                timestamp=datetime.now(timezone.utc),
+                message=f"Detected {missing_count} missing models (threshold: {threshold})",
+                timestamp=now,
                 metrics={
                     'missing_count': missing_count,
-                    'threshold': self.alert_thresholds['missing_models_threshold'],
+                    'threshold': threshold,
                     'examples': metrics.missing_models[:5]
                 },
                 suggested_actions=[
@@ -507,7 +915,7 @@ class CompletenessAlertSystem:
             )
             self.alerts.append(alert)
     
-    async def _check_data_quality(self, metrics: CompletenessMetrics) -> None:
+    async def _check_data_quality(self, metrics: CompletenessMetrics, now: datetime) -> None:
         """Check data quality metrics and generate alerts."""
         if metrics.total_models_processed == 0:
             return
@@ -520,7 +928,7 @@ class CompletenessAlertSystem:
                 severity=AlertSeverity.WARNING,
                 title="Low Data Quality",
                 message=f"Only {complete_data_rate:.1f}% of models have complete data",
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
                 metrics={
                     'complete_data_rate': complete_data_rate,
                     'models_with_complete_data': metrics.models_with_complete_data,
@@ -539,7 +947,7 @@ class CompletenessAlertSystem:
                 severity=AlertSeverity.WARNING,
                 title="File Accessibility Issues",
                 message=f"Only {accessible_files_rate:.1f}% of models have accessible files",
-                timestamp=datetime.now(timezone.utc),
+                timestamp=now,
                 metrics={
                     'accessible_files_rate': accessible_files_rate,
                     'models_with_accessible_files': metrics.models_with_accessible_files,
@@ -555,26 +963,19 @@ class CompletenessAlertSystem:
     
     async def _send_alerts(self) -> None:
         """Send alerts through configured channels."""
-        logger.info(f"🚨 Sending {len(self.alerts)} alerts...")
+        logger.info("🚨 Sending %d alerts...", len(self.alerts))
         
         for alert in self.alerts:
             # Log alert (always enabled)
-            severity_emoji = {
-                AlertSeverity.INFO: "ℹ️",
-                AlertSeverity.WARNING: "⚠️",
-                AlertSeverity.CRITICAL: "🚨",
-                AlertSeverity.EMERGENCY: "🆘"
-            }
-            
-            emoji = severity_emoji.get(alert.severity, "🔔")
-            logger.warning(f"{emoji} ALERT [{alert.severity.value.upper()}]: {alert.title}")
-            logger.warning(f"   Message: {alert.message}")
-            logger.warning(f"   Time: {alert.timestamp.isoformat()}")
+            emoji = _SEVERITY_EMOJI.get(alert.severity, "🔔")
+            logger.warning("%s ALERT [%s]: %s", emoji, _SEVERITY_LABEL[alert.severity], alert.title)
+            logger.warning("   Message: %s", alert.message)
+            logger.warning("   Time: %s", alert.timestamp.isoformat())
             
             if alert.suggested_actions:
                 logger.warning("   Suggested Actions:")
                 for action in alert.suggested_actions:
-                    logger.warning(f"     • {action}")
+                    logger.warning("     • %s", action)
             
             # Additional notification channels could be implemented here
             # (email, Slack, webhooks, etc.)
@@ -587,12 +988,21 @@ class CompletenessMonitor:
         self.rate_limiter = rate_limiter
         self.config = config or {}
         
-        self.verifier = CompletenessVerifier(api, rate_limiter, config)
-        self.recovery_system = MissingModelRecovery(api, rate_limiter)
+        # Single Hugging Face HTTP client shared by every component
+        self.http_client = HuggingFaceAPIClient(rate_limiter, token=getattr(api, 'token', None))
+        
+        self.verifier = CompletenessVerifier(api, rate_limiter, config, self.http_client)
+        self.recovery_system = MissingModelRecovery(api, rate_limiter, self.http_client)
         self.alert_system = CompletenessAlertSystem(config)
         
         self.monitoring_enabled = self.config.get('monitoring_enabled', True)
         self.auto_recovery_enabled = self.config.get('auto_recovery_enabled', True)
+        
+        # Last report and the digest of the inputs that produced it
+        self.report_cache_ttl = self.config.get('report_cache_ttl', 3600)
+        self._last_digest: Optional[bytes] = None
+        self._last_report: Optional[Dict[str, Any]] = None
+        self._last_report_expires = 0.0
     
     async def perform_completeness_check(self, processed_models: List[Dict[str, Any]], 
                                        discovery_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -601,11 +1011,18 @@ class CompletenessMonitor:
             logger.info("📊 Completeness monitoring is disabled")
             return {'monitoring_enabled': False}
         
+        # Skip the whole pipeline if nothing changed since the last check
+        columns = _extract_columns(processed_models)
+        digest = _verification_digest(columns, discovery_results)
+        if digest == self._last_digest and time.monotonic() < self._last_report_expires:
+            logger.info("📊 Processed models unchanged since last check, reusing report")
+            return self._last_report
+        
         logger.info("🔍 Starting comprehensive completeness monitoring...")
         start_time = time.time()
         
         # Verify completeness
-        metrics = await self.verifier.verify_completeness(processed_models, discovery_results)
+        metrics = await self.verifier.verify_completeness(processed_models, discovery_results, columns)
         
         # Attempt recovery if enabled and needed
         recovery_results = {}
@@ -618,7 +1035,8 @@ class CompletenessMonitor:
         alerts = await self.alert_system.evaluate_and_alert(metrics)
         
         # Compile comprehensive report
-        monitoring_time = time.time() - start_time
+        end_time = time.time()
+        monitoring_time = end_time - start_time
         
         report = {
             'monitoring_enabled': True,
@@ -639,24 +1057,22 @@ class CompletenessMonitor:
                 'strategy_effectiveness': metrics.strategy_effectiveness
             },
             'recovery_results': recovery_results,
-            'alerts': [
-                {
-                    'severity': alert.severity.value,
-                    'title': alert.title,
-                    'message': alert.message,
-                    'timestamp': alert.timestamp.isoformat(),
-                    'metrics': alert.metrics,
-                    'suggested_actions': alert.suggested_actions
-                }
-                for alert in alerts
-            ],
+            'alerts': [alert.to_dict() for alert in alerts],
             'monitoring_time': monitoring_time,
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': datetime.fromtimestamp(end_time, timezone.utc).isoformat()
         }
         
-        logger.info(f"✅ Completeness monitoring completed in {monitoring_time:.1f}s")
+        logger.info("✅ Completeness monitoring completed in %.1fs", monitoring_time)
+        
+        self._last_digest = digest
+        self._last_report = report
+        self._last_report_expires = time.monotonic() + self.report_cache_ttl
         return report
     
+    async def aclose(self) -> None:
+        """Release network resources held by the monitor."""
+        await self.http_client.close()
+    
     async def save_completeness_metadata(self, report: Dict[str, Any], 
                                        output_file: str = "data/completeness_metadata.json") -> None:
         """Save completeness metadata to file."""
@@ -665,22 +1081,29 @@ class CompletenessMonitor:
             data_dir = Path(output_file).parent
             data_dir.mkdir(exist_ok=True)
             
-            async with aiofiles.open(output_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(report, indent=2))
+            if orjson is not None:
+                payload = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+            else:
+                payload = json.dumps(report, indent=2).encode('utf-8')
+            
+            # One synchronous write, kept off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, Path(output_file).write_bytes, payload)
             
-            logger.info(f"💾 Completeness metadata saved to {output_file}")
+            logger.info("💾 Completeness metadata saved to %s", output_file)
             
         except Exception as e:
-            logger.error(f"❌ Failed to save completeness metadata: {e}")
+            logger.error("❌ Failed to save completeness metadata: %s", e)
 
 # Export main classes and functions
 __all__ = [
     'CompletenessMonitor',
+    'HuggingFaceAPIClient',
     'CompletenessVerifier', 
     'CompletenessMetrics',
     'CompletenessStatus',
     'CompletenessAlert',
     'AlertSeverity',
     'MissingModelRecovery',
+    'MissingModelTable',
     'CompletenessAlertSystem'
 ]
\ No newline at end of file
@@ -7,17 +7,78 @@ environment-specific configurations, validation, and deployment support.
 """
 
 import os
+import copy
+import functools
+import hashlib
 import json
+import re
+import sys
+import tempfile
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Any, Optional, List, Tuple, Union
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
 import logging
+from operator import attrgetter
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C extension when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+_yaml_backend_reported = False
+
+# Five whitespace-separated cron fields; minute and hour are captured for range checks
+_CRON_RE = re.compile(r'(\S+)\s+(\S+)\s+\S+\s+\S+\s+\S+')
+_CRON_NUMBER_RE = re.compile(r'\d+')
+
+# Directories already created (or found to exist) by this process
+_CREATED_DIRS: set = set()
+_CREATED_DIRS_LOCK = threading.Lock()
+
+def _ensure_dir(path: Union[str, Path]) -> None:
+    """Create a directory once per process; later calls for the same path are free."""
+    resolved = os.path.realpath(path)
+    if resolved in _CREATED_DIRS:
+        return
+    Path(resolved).mkdir(parents=True, exist_ok=True)
+    with _CREATED_DIRS_LOCK:
+        _CREATED_DIRS.add(resolved)
+
+def _atomic_write_bytes(path: Union[str, Path], payload: bytes) -> None:
+    """Write payload to a temporary sibling file, then swap it into place.
+    
+    Readers see either the old file or the complete new one, never a
+    half-written file.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+# Supported configuration file suffixes
+_CONFIG_FORMATS = {'.yaml': 'yaml', '.yml': 'yaml', '.json': 'json'}
+
+# Parsed configuration files keyed by (absolute path, st_mtime_ns, st_size),
+# shared by every ConfigurationManager in the process
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__-backed instances
+slotted_dataclass = functools.partial(dataclass, slots=True) if sys.version_info >= (3, 10) else dataclass
+
 class SyncMode(Enum):
     """Enumeration of sync modes."""
     INCREMENTAL = "incremental"
@@ -39,7 +100,7 @@ class LogLevel(Enum):
     ERROR = "ERROR"
     CRITICAL = "CRITICAL"
 
-@dataclass
+@slotted_dataclass
 class RateLimitConfig:
     """Configuration for API rate limiting."""
     requests_per_second: float = 1.2
@@ -50,7 +111,7 @@ class RateLimitConfig:
     max_retries: int = 5
     timeout_seconds: int = 30
 
-@dataclass
+@slotted_dataclass
 class SyncBehaviorConfig:
     """Configuration for sync behavior."""
     mode: SyncMode = SyncMode.AUTO
@@ -61,7 +122,7 @@ class SyncBehaviorConfig:
     enable_multi_strategy_discovery: bool = True
     enable_deduplication: bool = True
 
-@dataclass
+@slotted_dataclass
 class ValidationConfig:
     """Configuration for data validation."""
     enable_schema_validation: bool = True
@@ -72,7 +133,7 @@ class ValidationConfig:
     enable_automatic_fixes: bool = True
     validation_timeout_seconds: int = 300
 
-@dataclass
+@slotted_dataclass
 class ErrorHandlingConfig:
     """Configuration for error handling and recovery."""
     enable_error_recovery: bool = True
@@ -83,7 +144,7 @@ class ErrorHandlingConfig:
     recovery_delay_seconds: int = 60
     preserve_data_on_failure: bool = True
 
-@dataclass
+@slotted_dataclass
 class MonitoringConfig:
     """Configuration for monitoring and alerting."""
     enable_detailed_logging: bool = True
@@ -94,7 +155,7 @@ class MonitoringConfig:
     alert_channels: List[str] = field(default_factory=lambda: ["log", "github"])
     enable_dashboard: bool = False
 
-@dataclass
+@slotted_dataclass
 class PerformanceConfig:
     """Configuration for performance optimization."""
     enable_streaming_processing: bool = True
@@ -106,7 +167,7 @@ class PerformanceConfig:
     chunk_size: int = 100
     enable_adaptive_parameters: bool = True
 
-@dataclass
+@slotted_dataclass
 class StorageConfig:
     """Configuration for data storage."""
     data_directory: str = "data"
@@ -118,7 +179,7 @@ class StorageConfig:
     backup_retention_days: int = 30
     enable_compression: bool = True
 
-@dataclass
+@slotted_dataclass
 class NotificationConfig:
     """Configuration for notifications."""
     enable_success_notifications: bool = False
@@ -129,7 +190,7 @@ class NotificationConfig:
     webhook_urls: List[str] = field(default_factory=list)
     email_recipients: List[str] = field(default_factory=list)
 
-@dataclass
+@slotted_dataclass
 class SecurityConfig:
     """Configuration for security settings."""
     enable_token_validation: bool = True
@@ -139,7 +200,7 @@ class SecurityConfig:
     mask_sensitive_data: bool = True
     allowed_domains: List[str] = field(default_factory=lambda: ["huggingface.co"])
 
-@dataclass
+@slotted_dataclass
 class DynamicRetentionConfig:
     """Configuration for dynamic model retention system."""
     retention_days: int = 30
@@ -155,7 +216,7 @@ class DynamicRetentionConfig:
     top_models_storage_path: str = "data/top_models.json"
     retention_metadata_path: str = "data/retention_metadata.json"
 
-@dataclass
+@slotted_dataclass
 class SyncConfiguration:
     """Main configuration class containing all sync parameters."""
     
@@ -212,7 +273,7 @@ class SyncConfiguration:
         ]
         
         for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
+            _ensure_dir(directory)
 
     def _apply_environment_overrides(self):
         """Apply environment-specific configuration overrides."""
@@ -237,45 +298,207 @@ class SyncConfiguration:
             self.notifications.enable_critical_notifications = True
             self.security.enable_audit_logging = True
 
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment flag such as 'true', '1', 'yes' or 'on'."""
+    return value.lower() in _TRUE_VALUES
+
+# Enum members by value, so string conversion is a plain dict lookup
+_ENVIRONMENT_BY_VALUE = {member.value: member for member in Environment}
+_SYNC_MODE_BY_VALUE = {member.value: member for member in SyncMode}
+_LOG_LEVEL_BY_VALUE = {member.value: member for member in LogLevel}
+
+def _lookup_enum(table: Dict[str, Enum], enum_class: type, value: str) -> Enum:
+    """Return the member of enum_class whose value is value, raising ValueError like Enum does."""
+    member = table.get(value)
+    if member is None:
+        raise ValueError(f"{value!r} is not a valid {enum_class.__name__}")
+    return member
+
+def _parse_environment(value: str) -> Environment:
+    return _lookup_enum(_ENVIRONMENT_BY_VALUE, Environment, value.lower())
+
+def _parse_sync_mode(value: str) -> SyncMode:
+    return _lookup_enum(_SYNC_MODE_BY_VALUE, SyncMode, value.lower())
+
+def _parse_log_level(value: str) -> LogLevel:
+    return _lookup_enum(_LOG_LEVEL_BY_VALUE, LogLevel, value.upper())
+
+# Environment variable overrides: (variable, config key path, converter)
+_ENV_MAPPINGS = (
+    ('SYNC_ENVIRONMENT', ('environment',), _parse_environment),
+    ('SYNC_MODE', ('sync_behavior', 'mode'), _parse_sync_mode),
+    ('LOG_LEVEL', ('log_level',), _parse_log_level),
+    ('DEBUG_MODE', ('debug_mode',), _parse_bool),
+    ('DRY_RUN', ('dry_run',), _parse_bool),
+
+    # Rate limiting
+    ('MAX_CONCURRENCY', ('rate_limiting', 'max_concurrent_requests'), int),
+    ('REQUESTS_PER_SECOND', ('rate_limiting', 'requests_per_second'), float),
+    ('REQUESTS_PER_HOUR', ('rate_limiting', 'requests_per_hour'), int),
+    ('MAX_RETRIES', ('rate_limiting', 'max_retries'), int),
+    ('TIMEOUT_SECONDS', ('rate_limiting', 'timeout_seconds'), int),
+
+    # Sync behavior
+    ('INCREMENTAL_WINDOW_HOURS', ('sync_behavior', 'incremental_window_hours'), int),
+    ('FULL_SYNC_THRESHOLD_HOURS', ('sync_behavior', 'full_sync_threshold_hours'), int),
+    ('FORCE_FULL_SYNC', ('sync_behavior', 'force_full_sync'), _parse_bool),
+
+    # Monitoring
+    ('ENABLE_DETAILED_LOGGING', ('monitoring', 'enable_detailed_logging'), _parse_bool),
+    ('PROGRESS_REPORT_INTERVAL', ('monitoring', 'progress_report_interval_seconds'), int),
+    ('ENABLE_PERFORMANCE_METRICS', ('monitoring', 'enable_performance_metrics'), _parse_bool),
+
+    # Workflow
+    ('WORKFLOW_TIMEOUT_HOURS', ('workflow_timeout_hours',), int),
+
+    # API
+    ('HUGGINGFACE_TOKEN', ('huggingface_token',), str),
+    ('API_BASE_URL', ('api_base_url',), str),
+
+    # Dynamic retention
+    ('RETENTION_DAYS', ('dynamic_retention', 'retention_days'), int),
+    ('TOP_MODELS_COUNT', ('dynamic_retention', 'top_models_count'), int),
+    ('UPDATE_SCHEDULE_CRON', ('dynamic_retention', 'update_schedule_cron'), str),
+    ('ENABLE_CLEANUP', ('dynamic_retention', 'enable_cleanup'), _parse_bool),
+    ('CLEANUP_BATCH_SIZE', ('dynamic_retention', 'cleanup_batch_size'), int),
+    ('PRESERVE_DOWNLOAD_THRESHOLD', ('dynamic_retention', 'preserve_download_threshold'), int),
+    ('ENABLE_RANKING_HISTORY', ('dynamic_retention', 'enable_ranking_history'), _parse_bool),
+    ('RANKING_HISTORY_DAYS', ('dynamic_retention', 'ranking_history_days'), int),
+    ('ENABLE_RETENTION_MODE', ('dynamic_retention', 'enable_retention_mode'), _parse_bool),
+    ('RECENT_MODELS_PRIORITY', ('dynamic_retention', 'recent_models_priority'), _parse_bool),
+    ('TOP_MODELS_STORAGE_PATH', ('dynamic_retention', 'top_models_storage_path'), str),
+    ('RETENTION_METADATA_PATH', ('dynamic_retention', 'retention_metadata_path'), str),
+)
+
+def _to_dict(obj: Any) -> Any:
+    """Convert a configuration dataclass tree to plain YAML/JSON-ready values.
+    
+    Unlike dataclasses.asdict this does not deep-copy scalars, and enums are
+    converted to their values on the way through.
+    """
+    if is_dataclass(obj):
+        return {f.name: _to_dict(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, list):
+        return [_to_dict(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _to_dict(value) for key, value in obj.items()}
+    return obj
+
+_ENV_MAPPING_BY_NAME = {env_var: (keys, converter) for env_var, keys, converter in _ENV_MAPPINGS}
+_ENV_NAMES = frozenset(_ENV_MAPPING_BY_NAME)
+
+def _convert_sync_behavior(nested_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a string sync mode into SyncMode, copying the section only when it changes."""
+    mode = nested_dict.get('mode')
+    if isinstance(mode, str):
+        return {**nested_dict, 'mode': _parse_sync_mode(mode)}
+    return nested_dict
+
+# Nested sections of SyncConfiguration: (key, dataclass, optional enum fixer)
+_NESTED_CONFIG_SPECS = (
+    ('rate_limiting', RateLimitConfig, None),
+    ('sync_behavior', SyncBehaviorConfig, _convert_sync_behavior),
+    ('validation', ValidationConfig, None),
+    ('error_handling', ErrorHandlingConfig, None),
+    ('monitoring', MonitoringConfig, None),
+    ('performance', PerformanceConfig, None),
+    ('storage', StorageConfig, None),
+    ('notifications', NotificationConfig, None),
+    ('security', SecurityConfig, None),
+    ('dynamic_retention', DynamicRetentionConfig, None),
+)
+
+# Top-level enum fields: (key, parser applied to string values)
+_ENUM_CONVERTERS = (
+    ('environment', _parse_environment),
+    ('log_level', _parse_log_level),
+)
+
+# Range checks run by validate_configuration: (attribute path, predicate, error message)
+_VALIDATION_RULES = (
+    ('rate_limiting.requests_per_second', lambda v: v > 0, "Requests per second must be positive"),
+    ('rate_limiting.max_concurrent_requests', lambda v: v > 0, "Max concurrent requests must be positive"),
+    ('sync_behavior.incremental_window_hours', lambda v: v > 0, "Incremental window hours must be positive"),
+    ('sync_behavior.full_sync_threshold_hours', lambda v: v > 0, "Full sync threshold hours must be positive"),
+    ('validation.min_completeness_score', lambda v: 0 <= v <= 1, "Min completeness score must be between 0 and 1"),
+    ('workflow_timeout_hours', lambda v: 0 < v <= 24, "Workflow timeout must be between 1 and 24 hours"),
+    ('dynamic_retention.retention_days', lambda v: v > 0, "Retention days must be positive"),
+    ('dynamic_retention.retention_days', lambda v: v <= 365, "Retention days cannot exceed 365 days"),
+    ('dynamic_retention.top_models_count', lambda v: v > 0, "Top models count must be positive"),
+    ('dynamic_retention.top_models_count', lambda v: v <= 1000, "Top models count cannot exceed 1000"),
+    ('dynamic_retention.cleanup_batch_size', lambda v: v > 0, "Cleanup batch size must be positive"),
+    ('dynamic_retention.preserve_download_threshold', lambda v: v >= 0, "Preserve download threshold cannot be negative"),
+    ('dynamic_retention.ranking_history_days', lambda v: v > 0, "Ranking history days must be positive"),
+    ('dynamic_retention.ranking_history_days', lambda v: v <= 365, "Ranking history days cannot exceed 365 days"),
+)
+_VALIDATION_GETTERS = tuple((attrgetter(path), predicate, message) for path, predicate, message in _VALIDATION_RULES)
+
+def _report_yaml_backend() -> None:
+    """Log once which YAML loader is in use, so deployments can confirm libyaml is available."""
+    global _yaml_backend_reported
+    if not _yaml_backend_reported:
+        _yaml_backend_reported = True
+        logger.info(f"📋 YAML loader: {_YamlLoader.__name__}")
+
+@functools.lru_cache(maxsize=4)
+def _resolve_default_config_path(env: str, cwd: str) -> str:
+    """Pick the default config file for an environment.
+    
+    The paths are relative, so the working directory is part of the cache key.
+    """
+    # Check for environment-specific config first
+    env_config_path = f"config/sync-config-{env}.yaml"
+    
+    if Path(env_config_path).exists():
+        return env_config_path
+    
+    # Fall back to default config
+    return "config/sync-config.yaml"
+
 class ConfigurationManager:
     """Manages configuration loading, validation, and environment-specific settings."""
     
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
+        # Resolve the path and its format once rather than on every load
+        self._config_path_obj = Path(self.config_path).resolve()
+        self._format = _CONFIG_FORMATS.get(self._config_path_obj.suffix.lower())
         self.config: Optional[SyncConfiguration] = None
-        self._validation_errors: List[str] = []
+        # Stays an empty tuple until the first error, so clean validations allocate nothing
+        self._validation_errors: Union[Tuple[str, ...], List[str]] = ()
+        self._summary_cache: Optional[Dict[str, Any]] = None
     
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
-        # Check for environment-specific config first
-        env = os.getenv('SYNC_ENVIRONMENT', 'production').lower()
-        env_config_path = f"config/sync-config-{env}.yaml"
-        
-        if Path(env_config_path).exists():
-            return env_config_path
-        
-        # Fall back to default config
-        return "config/sync-config.yaml"
+        return _resolve_default_config_path(os.getenv('SYNC_ENVIRONMENT', 'production').lower(), os.getcwd())
     
     def load_configuration(self) -> SyncConfiguration:
         """Load configuration from file with environment variable overrides."""
         logger.info(f"📋 Loading configuration from {self.config_path}")
+        self._summary_cache = None
         
         # Start with default configuration
         config_dict = {}
         
         # Load from file if it exists
-        if Path(self.config_path).exists():
+        if self._config_path_obj.exists():
             config_dict = self._load_config_file()
         else:
             logger.warning(f"⚠️ Configuration file not found: {self.config_path}")
             logger.info("📋 Using default configuration")
         
-        # Apply environment variable overrides
-        config_dict = self._apply_environment_overrides(config_dict)
+        # Collect environment variable overrides
+        overrides = self._collect_environment_overrides()
         
-        # Create configuration object
-        self.config = self._create_configuration(config_dict)
+        # Create configuration object; with nothing to apply, the defaults will do
+        if config_dict or overrides:
+            self.config = self._create_configuration(config_dict, overrides)
+        else:
+            self.config = create_default_configuration()
         
         # Validate configuration
         if not self.validate_configuration():
@@ -285,218 +508,216 @@ class ConfigurationManager:
         return self.config
     
     def _load_config_file(self) -> Dict[str, Any]:
-        """Load configuration from YAML or JSON file."""
+        """Load configuration from YAML or JSON file.
+        
+        Parsed files are cached per process and re-read only when their
+        modification time or size changes. Callers get a private copy,
+        since list values end up shared with the configuration objects.
+        """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                if self.config_path.endswith('.yaml') or self.config_path.endswith('.yml'):
-                    return yaml.safe_load(f) or {}
-                elif self.config_path.endswith('.json'):
-                    return json.load(f) or {}
-                else:
-                    raise ValueError(f"Unsupported config file format: {self.config_path}")
+            stat = self._config_path_obj.stat()
+            cache_key = (str(self._config_path_obj), stat.st_mtime_ns, stat.st_size)
+            
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                logger.debug(f"📋 Using cached configuration for {self.config_path}")
+                return copy.deepcopy(cached)
+            
+            if self._format == 'yaml':
+                config_dict = self._load_yaml_config()
+            elif self._format == 'json':
+                config_dict = json.loads(self._config_path_obj.read_bytes()) or {}
+            else:
+                raise ValueError(f"Unsupported config file format: {self.config_path}")
+            
+            with _CONFIG_CACHE_LOCK:
+                # Drop entries for earlier versions of the same file
+                for key in [key for key in _CONFIG_CACHE if key[0] == cache_key[0]]:
+                    del _CONFIG_CACHE[key]
+                _CONFIG_CACHE[cache_key] = config_dict
+            
+            return copy.deepcopy(config_dict)
         except Exception as e:
             logger.error(f"❌ Failed to load configuration file: {e}")
             return {}
     
-    def _apply_environment_overrides(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply environment variable overrides to configuration."""
-        logger.info("🔧 Applying environment variable overrides")
+    def _load_yaml_config(self) -> Dict[str, Any]:
+        """Parse a YAML config, preferring a compiled JSON companion built from it.
+        
+        The companion records a hash of the YAML it was compiled from and is
+        used only when that hash matches the current file exactly, so copied
+        or restored files (which can carry older mtimes) are never shadowed
+        by a stale companion. Companions are written only by compile().
+        """
+        yaml_bytes = self._config_path_obj.read_bytes()
+        compiled_path = self.compiled_path
+        try:
+            compiled = json.loads(Path(compiled_path).read_bytes())
+            if compiled.get('source_sha256') == hashlib.sha256(yaml_bytes).hexdigest():
+                logger.debug(f"📋 Using compiled configuration {compiled_path}")
+                return compiled['config'] or {}
+            logger.debug(f"📋 Ignoring out-of-date compiled configuration {compiled_path}")
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        
+        _report_yaml_backend()
+        return yaml.load(yaml_bytes, Loader=_YamlLoader) or {}
+    
+    @property
+    def compiled_path(self) -> str:
+        """Path of the JSON companion generated from a YAML configuration."""
+        return str(self._config_path_obj) + '.compiled.json'
+    
+    def compile(self) -> bool:
+        """Convert the YAML configuration to its JSON companion ahead of time (e.g. in CI).
+        
+        Configurations that JSON cannot represent exactly (such as non-string
+        mapping keys) are not compiled and keep loading from YAML.
+        """
+        if self._format != 'yaml':
+            logger.error(f"❌ Only YAML configurations can be compiled: {self.config_path}")
+            return False
         
-        # Environment variable mappings
-        env_mappings = {
-            'SYNC_ENVIRONMENT': ('environment', lambda x: Environment(x.lower())),
-            'SYNC_MODE': ('sync_behavior.mode', lambda x: SyncMode(x.lower())),
-            'LOG_LEVEL': ('log_level', lambda x: LogLevel(x.upper())),
-            'DEBUG_MODE': ('debug_mode', lambda x: x.lower() == 'true'),
-            'DRY_RUN': ('dry_run', lambda x: x.lower() == 'true'),
-            
-            # Rate limiting
-            'MAX_CONCURRENCY': ('rate_limiting.max_concurrent_requests', int),
-            'REQUESTS_PER_SECOND': ('rate_limiting.requests_per_second', float),
-            'REQUESTS_PER_HOUR': ('rate_limiting.requests_per_hour', int),
-            'MAX_RETRIES': ('rate_limiting.max_retries', int),
-            'TIMEOUT_SECONDS': ('rate_limiting.timeout_seconds', int),
-            
-            # Sync behavior
-            'INCREMENTAL_WINDOW_HOURS': ('sync_behavior.incremental_window_hours', int),
-            'FULL_SYNC_THRESHOLD_HOURS': ('sync_behavior.full_sync_threshold_hours', int),
-            'FORCE_FULL_SYNC': ('sync_behavior.force_full_sync', lambda x: x.lower() == 'true'),
-            
-            # Monitoring
-            'ENABLE_DETAILED_LOGGING': ('monitoring.enable_detailed_logging', lambda x: x.lower() == 'true'),
-            'PROGRESS_REPORT_INTERVAL': ('monitoring.progress_report_interval_seconds', int),
-            'ENABLE_PERFORMANCE_METRICS': ('monitoring.enable_performance_metrics', lambda x: x.lower() == 'true'),
-            
-            # Workflow
-            'WORKFLOW_TIMEOUT_HOURS': ('workflow_timeout_hours', int),
-            
-            # API
-            'HUGGINGFACE_TOKEN': ('huggingface_token', str),
-            'API_BASE_URL': ('api_base_url', str),
+        try:
+            yaml_bytes = self._config_path_obj.read_bytes()
+            config_dict = yaml.load(yaml_bytes, Loader=_YamlLoader) or {}
+            encoded_config = json.dumps(config_dict)
+            if json.loads(encoded_config) != config_dict:
+                logger.error(f"❌ Configuration does not round-trip through JSON, not compiling: {self.config_path}")
+                return False
             
-            # Dynamic retention
-            'RETENTION_DAYS': ('dynamic_retention.retention_days', int),
-            'TOP_MODELS_COUNT': ('dynamic_retention.top_models_count', int),
-            'UPDATE_SCHEDULE_CRON': ('dynamic_retention.update_schedule_cron', str),
-            'ENABLE_CLEANUP': ('dynamic_retention.enable_cleanup', lambda x: x.lower() == 'true'),
-            'CLEANUP_BATCH_SIZE': ('dynamic_retention.cleanup_batch_size', int),
-            'PRESERVE_DOWNLOAD_THRESHOLD': ('dynamic_retention.preserve_download_threshold', int),
-            'ENABLE_RANKING_HISTORY': ('dynamic_retention.enable_ranking_history', lambda x: x.lower() == 'true'),
-            'RANKING_HISTORY_DAYS': ('dynamic_retention.ranking_history_days', int),
-            'ENABLE_RETENTION_MODE': ('dynamic_retention.enable_retention_mode', lambda x: x.lower() == 'true'),
-            'RECENT_MODELS_PRIORITY': ('dynamic_retention.recent_models_priority', lambda x: x.lower() == 'true'),
-            'TOP_MODELS_STORAGE_PATH': ('dynamic_retention.top_models_storage_path', str),
-            'RETENTION_METADATA_PATH': ('dynamic_retention.retention_metadata_path', str),
-        }
-        
-        # Apply overrides
-        for env_var, (config_path, converter) in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value is not None:
-                try:
-                    converted_value = converter(env_value)
-                    self._set_nested_value(config_dict, config_path, converted_value)
-                    logger.debug(f"🔧 Override: {config_path} = {converted_value}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to apply override {env_var}: {e}")
-        
-        return config_dict
+            payload = json.dumps({
+                'source_sha256': hashlib.sha256(yaml_bytes).hexdigest(),
+                'config': config_dict
+            })
+            _atomic_write_bytes(self.compiled_path, payload.encode('utf-8'))
+            logger.info(f"💾 Compiled configuration written to {self.compiled_path}")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to compile configuration: {e}")
+            return False
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget every cached configuration file, forcing the next load to re-parse."""
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE.clear()
     
-    def _set_nested_value(self, config_dict: Dict[str, Any], path: str, value: Any):
-        """Set a nested value in the configuration dictionary."""
-        keys = path.split('.')
-        current = config_dict
-        
-        # Navigate to the parent of the target key
-        for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        
-        # Set the final value
-        current[keys[-1]] = value
+    def _collect_environment_overrides(self) -> Dict[Tuple[str, ...], Any]:
+        """Collect environment variable overrides, keyed by configuration key path.
+        
+        The parsed configuration is left untouched; the overrides are layered
+        on top of it when the configuration objects are built.
+        """
+        overrides: Dict[Tuple[str, ...], Any] = {}
+        
+        # Only the variables that are actually set need any work
+        env = os.environ
+        present = _ENV_NAMES & env.keys()
+        if not present:
+            return overrides
+        
+        logger.info("🔧 Applying environment variable overrides")
+        
+        for env_var in present:
+            keys, converter = _ENV_MAPPING_BY_NAME[env_var]
+            try:
+                converted_value = converter(env[env_var])
+                overrides[keys] = converted_value
+                logger.debug(f"🔧 Override: {'.'.join(keys)} = {converted_value}")
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to apply override {env_var}: {e}")
+        
+        return overrides
     
-    def _create_configuration(self, config_dict: Dict[str, Any]) -> SyncConfiguration:
-        """Create SyncConfiguration object from dictionary."""
+    def _create_configuration(self, config_dict: Dict[str, Any],
+                              overrides: Optional[Dict[Tuple[str, ...], Any]] = None) -> SyncConfiguration:
+        """Create SyncConfiguration object from dictionary, with overrides layered on top."""
         try:
-            # Handle nested configurations
-            nested_configs = {
-                'rate_limiting': RateLimitConfig,
-                'sync_behavior': SyncBehaviorConfig,
-                'validation': ValidationConfig,
-                'error_handling': ErrorHandlingConfig,
-                'monitoring': MonitoringConfig,
-                'performance': PerformanceConfig,
-                'storage': StorageConfig,
-                'notifications': NotificationConfig,
-                'security': SecurityConfig,
-                'dynamic_retention': DynamicRetentionConfig,
-            }
+            values = dict(config_dict)
+            
+            # Override key paths are at most two levels deep: a top-level field,
+            # or a field inside one of the nested sections
+            section_overrides: Dict[str, Dict[str, Any]] = {}
+            for keys, value in (overrides or {}).items():
+                if len(keys) == 1:
+                    values[keys[0]] = value
+                else:
+                    section_overrides.setdefault(keys[0], {})[keys[1]] = value
             
             # Create nested configuration objects
-            for key, config_class in nested_configs.items():
-                if key in config_dict and isinstance(config_dict[key], dict):
-                    nested_dict = config_dict[key].copy()
-                    
-                    # Handle enums in nested configurations
-                    if key == 'sync_behavior' and 'mode' in nested_dict and isinstance(nested_dict['mode'], str):
-                        nested_dict['mode'] = SyncMode(nested_dict['mode'].lower())
-                    
-                    config_dict[key] = config_class(**nested_dict)
+            for key, config_class, fixer in _NESTED_CONFIG_SPECS:
+                nested_dict = values.get(key)
+                extra = section_overrides.get(key)
+                if extra:
+                    nested_dict = {**nested_dict, **extra} if isinstance(nested_dict, dict) else extra
+                if isinstance(nested_dict, dict):
+                    if fixer is not None:
+                        nested_dict = fixer(nested_dict)
+                    values[key] = config_class(**nested_dict)
             
             # Handle enums
-            if 'environment' in config_dict and isinstance(config_dict['environment'], str):
-                config_dict['environment'] = Environment(config_dict['environment'].lower())
-            
-            if 'log_level' in config_dict and isinstance(config_dict['log_level'], str):
-                config_dict['log_level'] = LogLevel(config_dict['log_level'].upper())
+            for key, parser in _ENUM_CONVERTERS:
+                value = values.get(key)
+                if isinstance(value, str):
+                    values[key] = parser(value)
             
-            return SyncConfiguration(**config_dict)
+            return SyncConfiguration(**values)
             
         except Exception as e:
             logger.error(f"❌ Failed to create configuration object: {e}")
             # Return default configuration on error
             return SyncConfiguration()
     
+    def _add_error(self, message: str) -> None:
+        """Record a validation error, switching to a list on the first one."""
+        if isinstance(self._validation_errors, tuple):
+            self._validation_errors = list(self._validation_errors)
+        self._validation_errors.append(message)
+    
     def validate_configuration(self) -> bool:
         """Validate the loaded configuration."""
         if not self.config:
-            self._validation_errors.append("Configuration not loaded")
+            self._add_error("Configuration not loaded")
             return False
         
-        self._validation_errors.clear()
+        self._validation_errors = ()
+        self._summary_cache = None
         
         # Validate required fields
         if not self.config.huggingface_token:
-            self._validation_errors.append("Hugging Face token is required")
-        
-        # Validate rate limiting
-        if self.config.rate_limiting.requests_per_second <= 0:
-            self._validation_errors.append("Requests per second must be positive")
-        
-        if self.config.rate_limiting.max_concurrent_requests <= 0:
-            self._validation_errors.append("Max concurrent requests must be positive")
+            self._add_error("Hugging Face token is required")
         
-        # Validate sync behavior
-        if self.config.sync_behavior.incremental_window_hours <= 0:
-            self._validation_errors.append("Incremental window hours must be positive")
-        
-        if self.config.sync_behavior.full_sync_threshold_hours <= 0:
-            self._validation_errors.append("Full sync threshold hours must be positive")
-        
-        # Validate validation config
-        if self.config.validation.min_completeness_score < 0 or self.config.validation.min_completeness_score > 1:
-            self._validation_errors.append("Min completeness score must be between 0 and 1")
+        # Validate numeric ranges
+        for getter, predicate, message in _VALIDATION_GETTERS:
+            if not predicate(getter(self.config)):
+                self._add_error(message)
         
         # Validate directories
         try:
-            Path(self.config.storage.data_directory).mkdir(parents=True, exist_ok=True)
-            Path(self.config.storage.reports_directory).mkdir(parents=True, exist_ok=True)
+            _ensure_dir(self.config.storage.data_directory)
+            _ensure_dir(self.config.storage.reports_directory)
         except Exception as e:
-            self._validation_errors.append(f"Cannot create required directories: {e}")
-        
-        # Validate workflow timeout
-        if self.config.workflow_timeout_hours <= 0 or self.config.workflow_timeout_hours > 24:
-            self._validation_errors.append("Workflow timeout must be between 1 and 24 hours")
-        
-        # Validate dynamic retention configuration
-        if self.config.dynamic_retention.retention_days <= 0:
-            self._validation_errors.append("Retention days must be positive")
-        
-        if self.config.dynamic_retention.retention_days > 365:
-            self._validation_errors.append("Retention days cannot exceed 365 days")
-        
-        if self.config.dynamic_retention.top_models_count <= 0:
-            self._validation_errors.append("Top models count must be positive")
-        
-        if self.config.dynamic_retention.top_models_count > 1000:
-            self._validation_errors.append("Top models count cannot exceed 1000")
-        
-        if self.config.dynamic_retention.cleanup_batch_size <= 0:
-            self._validation_errors.append("Cleanup batch size must be positive")
-        
-        if self.config.dynamic_retention.preserve_download_threshold < 0:
-            self._validation_errors.append("Preserve download threshold cannot be negative")
-        
-        if self.config.dynamic_retention.ranking_history_days <= 0:
-            self._validation_errors.append("Ranking history days must be positive")
-        
-        if self.config.dynamic_retention.ranking_history_days > 365:
-            self._validation_errors.append("Ranking history days cannot exceed 365 days")
+            self._add_error(f"Cannot create required directories: {e}")
         
         # Validate cron expression format (basic validation)
-        cron_parts = self.config.dynamic_retention.update_schedule_cron.split()
-        if len(cron_parts) != 5:
-            self._validation_errors.append("Update schedule cron must have 5 parts (minute hour day month weekday)")
+        cron_match = _CRON_RE.fullmatch(self.config.dynamic_retention.update_schedule_cron.strip())
+        if not cron_match:
+            self._add_error("Update schedule cron must have 5 parts (minute hour day month weekday)")
+        else:
+            minute, hour = cron_match.groups()
+            if any(int(value) > 59 for value in _CRON_NUMBER_RE.findall(minute)):
+                self._add_error("Update schedule cron minute must be between 0 and 59")
+            if any(int(value) > 23 for value in _CRON_NUMBER_RE.findall(hour)):
+                self._add_error("Update schedule cron hour must be between 0 and 23")
         
         # Validate storage paths
         try:
-            top_models_dir = Path(self.config.dynamic_retention.top_models_storage_path).parent
-            retention_metadata_dir = Path(self.config.dynamic_retention.retention_metadata_path).parent
-            top_models_dir.mkdir(parents=True, exist_ok=True)
-            retention_metadata_dir.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(Path(self.config.dynamic_retention.top_models_storage_path).parent)
+            _ensure_dir(Path(self.config.dynamic_retention.retention_metadata_path).parent)
         except Exception as e:
-            self._validation_errors.append(f"Cannot create dynamic retention directories: {e}")
+            self._add_error(f"Cannot create dynamic retention directories: {e}")
         
         # Log validation results
         if self._validation_errors:
@@ -516,20 +737,18 @@ class ConfigurationManager:
         output_path = output_path or self.config_path
         
         try:
-            # Convert to dictionary
-            config_dict = asdict(self.config)
-            
-            # Convert enums to strings
-            config_dict['environment'] = self.config.environment.value
-            config_dict['log_level'] = self.config.log_level.value
-            config_dict['sync_behavior']['mode'] = self.config.sync_behavior.mode.value
+            # Convert to dictionary, with enums as their string values
+            config_dict = _to_dict(self.config)
             
             # Ensure directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            output_dir = Path(output_path).parent
+            output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Save as YAML
-            with open(output_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            # Render the YAML in memory, then swap it into place atomically so
+            # an interrupted save never leaves a half-written config behind
+            payload = yaml.dump(config_dict, Dumper=_YamlDumper, default_flow_style=False,
+                                indent=2, encoding='utf-8')
+            _atomic_write_bytes(output_path, payload)
             
             logger.info(f"💾 Configuration saved to {output_path}")
             return True
@@ -539,11 +758,18 @@ class ConfigurationManager:
             return False
     
     def get_configuration_summary(self) -> Dict[str, Any]:
-        """Get a summary of the current configuration."""
+        """Get a summary of the current configuration.
+        
+        The summary is built once per load/validation and handed out as a
+        shallow copy, so repeated polling does not re-walk the config tree.
+        """
         if not self.config:
             return {"error": "No configuration loaded"}
         
-        return {
+        if self._summary_cache is not None:
+            return dict(self._summary_cache)
+        
+        self._summary_cache = {
             "environment": self.config.environment.value,
             "sync_mode": self.config.sync_behavior.mode.value,
             "debug_mode": self.config.debug_mode,
@@ -565,11 +791,20 @@ class ConfigurationManager:
             },
             "config_file": self.config_path,
             "validation_status": "valid" if not self._validation_errors else "invalid",
-            "validation_errors": self._validation_errors
+            "validation_errors": list(self._validation_errors)
         }
+        return dict(self._summary_cache)
 
 def create_default_configuration() -> SyncConfiguration:
     """Create a default configuration with recommended settings."""
+    config = copy.deepcopy(_default_configuration_template())
+    # The template is shared, so pick up the current token rather than the one seen at build time
+    config.huggingface_token = os.getenv('HUGGINGFACE_TOKEN')
+    return config
+
+@functools.lru_cache(maxsize=1)
+def _default_configuration_template() -> SyncConfiguration:
+    """Build the default configuration once; callers receive deep copies."""
     return SyncConfiguration(
         environment=Environment.PRODUCTION,
         log_level=LogLevel.INFO,
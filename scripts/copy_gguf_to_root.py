@@ -3,14 +3,214 @@ Simple script to copy the generated gguf_models.json from scripts/data to websit
 This ensures index.html can access the updated file.
 """
 
+import json
+import mmap
+import re
 import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 import os
 import sys
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; without it the source file is loaded in one go
+    ijson = None
+
+# Output is written in small per-model pieces; buffer them into large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Architecture keywords in detection priority, with their display names;
+# tags are matched case-insensitively in a single regex pass per tag
+_ARCH_CANONICAL = {
+    'llama': 'Llama',
+    'mistral': 'Mistral',
+    'gemma': 'Gemma',
+    'qwen': 'Qwen',
+    'phi': 'Phi',
+    'deepseek': 'DeepSeek',
+}
+_ARCH_KEYWORDS = tuple(_ARCH_CANONICAL.items())
+_ARCH_RE = re.compile('|'.join(_ARCH_CANONICAL), re.IGNORECASE)
+
+# Models are transformed and encoded in batches of this size; sources at least
+# PARALLEL_MIN_BYTES large spread the batches over a process pool
+BATCH_SIZE = 2000
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
 # Add the scripts directory to the path so we can import the config
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+def _to_legacy_model(model):
+    """Transform one registry entry into the legacy format expected by the website."""
+    get = model.get
+    model_id = get('id', '')
+
+    # Extract family and name from model ID
+    family, separator, name = model_id.partition('/')
+    if not separator:
+        family = 'Unknown'
+        name = model_id
+
+    # Extract architecture from tags or model name
+    architecture = 'Unknown'
+    tags = get('tags', ())
+    for tag in tags:
+        if _ARCH_RE.search(tag):
+            architecture = tag.split(':')[-1] if ':' in tag else tag
+            break
+    
+    # If no architecture found in tags, try to extract from model name
+    if architecture == 'Unknown':
+        model_name_lower = model_id.lower()
+        for keyword, canonical in _ARCH_KEYWORDS:
+            if keyword in model_name_lower:
+                architecture = canonical
+                break
+    
+    # Keep this a single dict display: CPython builds it presized in one step,
+    # which measured faster than assembling it key by key or via dict(zip(...))
+    return {
+        'modelId': model_id,
+        'files': [{'filename': f['filename'] if 'filename' in f else f.get('name', '')}
+                  for f in get('files') or ()],
+        'downloads': get('downloads', 0),
+        'lastModified': get('lastModified') or get('created_at'),
+        'family': family,
+        'name': name,
+        'architecture': architecture,
+        # Add freshness fields
+        'lastSynced': get('lastSynced'),
+        'freshnessStatus': get('freshnessStatus', 'unknown'),
+        'hoursSinceModified': get('hoursSinceModified'),
+        'hoursSinceSynced': get('hoursSinceSynced', 0.0)
+    }
+
+def _iter_source_models(data_file):
+    """Yield the models in the source file, one at a time when ijson is available."""
+    if ijson is not None:
+        with open(data_file, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    elif orjson is not None:
+        # Parse straight from the page cache instead of copying the file into a bytes object
+        with open(data_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                models = orjson.loads(view)
+        yield from models
+    else:
+        with open(data_file, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+def _encode_model(model, pretty=False):
+    """Encode one model as an element of a JSON array, compact or two-space indented."""
+    if not pretty:
+        if orjson is not None:
+            return orjson.dumps(model)
+        return json.dumps(model, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    if orjson is not None:
+        encoded = orjson.dumps(model, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(model, indent=2, ensure_ascii=False).encode('utf-8')
+    # Strings never contain raw newlines in JSON, so every newline is layout
+    return b'  ' + encoded.replace(b'\n', b'\n  ')
+
+def _element_separator(pretty):
+    return b',\n' if pretty else b','
+
+def _encode_batch(models, pretty=False):
+    """Transform and encode a batch of source models into joined array elements.
+    
+    Returns the encoded bytes and the number of models, so it can run in a
+    worker process and hand back a single cheap-to-pickle result.
+    """
+    encoded = _element_separator(pretty).join(_encode_model(_to_legacy_model(model), pretty) for model in models)
+    return encoded, len(models)
+
+def _iter_encoded_batches(source_models, pretty=False, workers=1):
+    """Yield encoded batches in source order, using a process pool when workers > 1."""
+    batches = iter(lambda: list(islice(source_models, BATCH_SIZE)), [])
+    if workers <= 1:
+        for batch in batches:
+            yield _encode_batch(batch, pretty)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep only a few batches in flight so memory stays bounded while streaming
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(_encode_batch, batch, pretty))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _write_legacy_models(encoded_batches, website_file, pretty=False):
+    """Stream encoded batches into website_file as a JSON array and return the model count.
+    
+    With ``pretty`` the output is JSON equivalent to json.dump(..., indent=2, ensure_ascii=False);
+    otherwise it is compact. The array is written to a temporary sibling and
+    swapped into place, so index.html never sees a half-written file.
+    """
+    first, last = (b'[\n', b'\n]') if pretty else (b'[', b']')
+    separator = _element_separator(pretty)
+    count = 0
+    fd, tmp_path = tempfile.mkstemp(dir=website_file.parent, prefix=f'.{website_file.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            for encoded, batch_count in encoded_batches:
+                f.write(first if count == 0 else separator)
+                f.write(encoded)
+                count += batch_count
+            f.write(last if count else b'[]')
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, website_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return count
+
+def _stamp_path(website_file):
+    """Sidecar recording which source and target files the last copy produced."""
+    return website_file.with_name(f".{website_file.name}.stamp")
+
+def _file_signature(stat):
+    """Size and modification time identifying one version of a file."""
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _is_up_to_date(data_file, website_file, pretty):
+    """True when the target is exactly what the last copy produced from the current source."""
+    try:
+        stamp = json.loads(_stamp_path(website_file).read_text(encoding='utf-8'))
+        return (stamp.get('source') == _file_signature(data_file.stat()) and
+                stamp.get('target') == _file_signature(website_file.stat()) and
+                stamp.get('pretty', False) == pretty)
+    except (OSError, ValueError, AttributeError):
+        return False
+
+def _write_stamp(data_file, website_file, pretty):
+    """Record the source and target versions of a completed copy."""
+    stamp = {
+        'source': _file_signature(data_file.stat()),
+        'target': _file_signature(website_file.stat()),
+        'pretty': pretty,
+    }
+    try:
+        _stamp_path(website_file).write_text(json.dumps(stamp), encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️ Could not record copy stamp: {e}")
+
 def copy_gguf_to_website():
     """Copy gguf_models.json from scripts/data to website output directory."""
     
@@ -46,6 +246,14 @@ def copy_gguf_to_website():
         print("   python update_models.py --retention-mode retention")
         return False
     
+    # index.html only parses the file, so it is written compact unless GGUF_PRETTY=1
+    pretty = os.getenv('GGUF_PRETTY') == '1'
+    
+    # Nothing to do if neither file changed since the last copy
+    if _is_up_to_date(data_file, website_file, pretty):
+        print("✅ Target file is up to date with the source - skipping")
+        return True
+    
     try:
         # Get file sizes for comparison
         source_size = data_file.stat().st_size
@@ -54,78 +262,20 @@ def copy_gguf_to_website():
         print(f"📊 Source file size: {source_size:,} bytes")
         print(f"📊 Target file size: {target_size:,} bytes")
         
-        # Load and transform the data to legacy format
-        import json
-        
-        with open(data_file, 'r', encoding='utf-8') as f:
-            retention_models = json.load(f)
-        
-        # Transform to legacy format expected by website
-        legacy_models = []
-        for model in retention_models:
-            model_id = model.get('id', '')
-            
-            # Extract family and name from model ID
-            if '/' in model_id:
-                parts = model_id.split('/')
-                family = parts[0]
-                name = '/'.join(parts[1:]) if len(parts) > 1 else parts[0]
-            else:
-                family = 'Unknown'
-                name = model_id
-            
-            # Extract architecture from tags or model name
-            architecture = 'Unknown'
-            tags = model.get('tags', [])
-            for tag in tags:
-                if any(arch in tag.lower() for arch in ['llama', 'mistral', 'gemma', 'qwen', 'phi', 'deepseek']):
-                    architecture = tag.split(':')[-1] if ':' in tag else tag
-                    break
-            
-            # If no architecture found in tags, try to extract from model name
-            if architecture == 'Unknown':
-                model_name_lower = model_id.lower()
-                if 'llama' in model_name_lower:
-                    architecture = 'Llama'
-                elif 'mistral' in model_name_lower:
-                    architecture = 'Mistral'
-                elif 'gemma' in model_name_lower:
-                    architecture = 'Gemma'
-                elif 'qwen' in model_name_lower:
-                    architecture = 'Qwen'
-                elif 'phi' in model_name_lower:
-                    architecture = 'Phi'
-                elif 'deepseek' in model_name_lower:
-                    architecture = 'DeepSeek'
-            
-            legacy_model = {
-                'modelId': model_id,
-                'files': [{'filename': f.get('filename', f.get('name', ''))} 
-                         for f in model.get('files', [])],
-                'downloads': model.get('downloads', 0),
-                'lastModified': model.get('lastModified') or model.get('created_at'),
-                'family': family,
-                'name': name,
-                'architecture': architecture,
-                # Add freshness fields
-                'lastSynced': model.get('lastSynced'),
-                'freshnessStatus': model.get('freshnessStatus', 'unknown'),
-                'hoursSinceModified': model.get('hoursSinceModified'),
-                'hoursSinceSynced': model.get('hoursSinceSynced', 0.0)
-            }
-            legacy_models.append(legacy_model)
-        
         # Ensure website output directory exists
         website_output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Write the transformed data
-        with open(website_file, 'w', encoding='utf-8') as f:
-            json.dump(legacy_models, f, indent=2, ensure_ascii=False)
+        # Transform to legacy format expected by website, streaming batch by batch;
+        # large registries are transformed on every available core
+        workers = (os.cpu_count() or 1) if source_size >= PARALLEL_MIN_BYTES else 1
+        encoded_batches = _iter_encoded_batches(_iter_source_models(data_file), pretty, workers)
+        model_count = _write_legacy_models(encoded_batches, website_file, pretty)
+        _write_stamp(data_file, website_file, pretty)
         
         # Verify the transformation
         new_target_size = website_file.stat().st_size
         print(f"✅ File transformed and saved successfully!")
-        print(f"📊 Transformed {len(legacy_models)} models to legacy format")
+        print(f"📊 Transformed {model_count} models to legacy format")
         print(f"📊 New target file size: {new_target_size:,} bytes")
         
         if new_target_size == source_size:
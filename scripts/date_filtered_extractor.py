@@ -9,8 +9,10 @@ date-based filtering, API integration, and error handling.
 
 import asyncio
 import logging
+import re
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
+from urllib.parse import urlencode
 from dataclasses import dataclass
 from huggingface_hub import HfApi
 from dateutil import parser as date_parser
@@ -18,9 +20,21 @@ from dateutil import parser as date_parser
 # Import existing systems for integration
 from config_system import SyncConfiguration, DynamicRetentionConfig
 from error_handling import with_error_handling, ErrorContext
+from completeness_system import HuggingFaceAPIClient
 
 logger = logging.getLogger(__name__)
 
+# /api/models query for recent GGUF models: GGUF filtered server-side, newest first.
+# The Hub has no created-after parameter, so the cutoff date is applied by
+# stopping pagination at the first model older than it
+RECENT_MODELS_QUERY = {'filter': 'gguf', 'sort': 'createdAt', 'direction': -1, 'full': 'true'}
+
+# GGUF indicators, compiled once. Model IDs also match quantization patterns
+# (q4_k_m, q8_0, iq2_xs, f16, bf16, int8, ...), which cover the literal
+# quantization indicators; tags match only the literal indicators
+_GGUF_ID_RE = re.compile(r'gguf|ggml|q\d+_k_[msl]|q\d+_\d+|iq\d+_[a-z]+|b?f\d+|int\d+')
+_GGUF_TAG_RE = re.compile(r'gguf|ggml|q4_k_m|q4_0|q5_0|q8_0|f16|f32')
+
 @dataclass
 class ModelReference:
     """Reference to a model discovered through date filtering."""
@@ -55,7 +69,8 @@ class DateFilteredExtractor:
     the existing rate limiting and error handling systems.
     """
     
-    def __init__(self, config: SyncConfiguration, api: HfApi, rate_limiter):
+    def __init__(self, config: SyncConfiguration, api: HfApi, rate_limiter,
+                 http_client: Optional[HuggingFaceAPIClient] = None):
         """
         Initialize the DateFilteredExtractor.
         
@@ -63,10 +78,16 @@ class DateFilteredExtractor:
             config: System configuration containing retention settings
             api: HuggingFace API instance
             rate_limiter: Rate limiter for API calls
+            http_client: Shared async Hub client; one is created (and closed
+                after each extraction) if not provided
         """
         self.config = config
         self.api = api
         self.rate_limiter = rate_limiter
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or HuggingFaceAPIClient(
+            rate_limiter, token=getattr(api, 'token', None)
+        )
         
         # Get retention configuration
         self.retention_config = config.dynamic_retention
@@ -149,24 +170,30 @@ class DateFilteredExtractor:
         """
         Generate HuggingFace API query with date filters.
         
+        The date constraint is not part of the query string; results are sorted
+        newest first and pagination stops at the cutoff date.
+        
         Returns:
             str: Query string for HF API with date filtering
         """
         cutoff_date = self.calculate_cutoff_date()
         
-        # Format date for HF API (ISO format)
-        date_filter = cutoff_date.strftime("%Y-%m-%d")
+        # Construct query with GGUF filter and newest-first ordering
+        query = urlencode(RECENT_MODELS_QUERY)
         
-        # Construct query with GGUF filter and date constraint
-        query = f"gguf created:>{date_filter}"
-        
-        logger.debug(f"🔍 Generated date filter query: {query}")
+        logger.debug(f"🔍 Generated date filter query: {query} (until {cutoff_date.isoformat()})")
         return query
     
     async def _extract_models_with_date_filter(self, cutoff_date: datetime) -> tuple[List[ModelReference], int]:
         """
         Extract models using date filtering with proper API integration.
         
+        Pages of /api/models are fetched asynchronously, with the next page
+        prefetched while the current one is filtered, so the event loop is
+        never blocked and filtering overlaps with network I/O. Results come
+        newest first, so pagination stops at the first model older than the
+        cutoff date.
+        
         Args:
             cutoff_date: The cutoff date for filtering models
             
@@ -177,134 +204,137 @@ class DateFilteredExtractor:
         api_calls = 0
         
         try:
-            # Use the HF API search with date filtering
-            async with self.rate_limiter:
-                api_calls += 1
-                
-                # Search for GGUF models created after cutoff date
-                date_filter = cutoff_date.strftime("%Y-%m-%d")
-                
-                logger.info(f"🔍 Searching for GGUF models created after {date_filter}")
-                
-                # Use list_models with search parameter for date filtering
-                model_list = list(self.api.list_models(
-                    search=f"gguf",
-                    sort="createdAt",
-                    direction=-1,  # Most recent first
-                    limit=None  # Get all matching models
-                ))
-                
-                logger.info(f"📊 Found {len(model_list)} models from initial search")
+            # Search for GGUF models created after cutoff date
+            date_filter = cutoff_date.strftime("%Y-%m-%d")
             
-            # Filter models by actual creation date
-            filtered_models = []
-            for model in model_list:
-                try:
-                    # Get model creation date
-                    created_at = getattr(model, 'createdAt', None) or getattr(model, 'created_at', None)
-                    
-
-                    
-                    if created_at:
-                        # Parse the creation date
-                        if isinstance(created_at, str):
-                            model_date = date_parser.parse(created_at)
-                        else:
-                            model_date = created_at
-                        
-                        # Ensure timezone awareness
-                        if model_date.tzinfo is None:
-                            model_date = model_date.replace(tzinfo=timezone.utc)
-                        
-                        # Check if model is within our date range
-                        if model_date >= cutoff_date:
-                            # Verify this is actually a GGUF model
-                            if self._is_gguf_model(model):
-                                model_ref = ModelReference(
-                                    id=model.id,
-                                    discovery_method="date_filtered",
-                                    confidence_score=1.0,
-                                    metadata={
-                                        "created_at": model_date.isoformat(),
-                                        "downloads": getattr(model, 'downloads', 0),
-                                        "tags": getattr(model, 'tags', []),
-                                        "author": getattr(model, 'author', ''),
-                                        "pipeline_tag": getattr(model, 'pipeline_tag', '')
-                                    },
-                                    upload_date=model_date
-                                )
-                                filtered_models.append(model_ref)
-                    else:
-                        # If no creation date, include it to be safe (recent models priority)
-                        if self.retention_config.recent_models_priority and self._is_gguf_model(model):
-                            model_ref = ModelReference(
-                                id=model.id,
-                                discovery_method="date_filtered_no_date",
-                                confidence_score=0.8,
-                                metadata={
-                                    "created_at": None,
-                                    "downloads": getattr(model, 'downloads', 0),
-                                    "tags": getattr(model, 'tags', []),
-                                    "author": getattr(model, 'author', ''),
-                                    "pipeline_tag": getattr(model, 'pipeline_tag', '')
-                                },
-                                upload_date=None
-                            )
-                            filtered_models.append(model_ref)
-                            
-                except Exception as e:
-                    logger.debug(f"Error processing model {getattr(model, 'id', 'unknown')}: {e}")
-                    continue
+            logger.info(f"🔍 Searching for GGUF models created after {date_filter}")
+            
+            pages = self.http_client.iter_model_pages(**RECENT_MODELS_QUERY)
+            try:
+                async for page in pages:
+                    api_calls += 1
+                    page_models, reached_cutoff = self._filter_page(page, cutoff_date)
+                    models.extend(page_models)
+                    if reached_cutoff:
+                        break
+            finally:
+                # Stop prefetching right away rather than when the generator is collected
+                await pages.aclose()
             
-            models = filtered_models
+            logger.info(f"📊 Searched {api_calls} pages of models")
             logger.info(f"✅ Date filtering completed: {len(models)} models within {self.retention_days} days")
             
         except Exception as e:
             logger.error(f"❌ Error during date-filtered extraction: {e}")
             raise
+        finally:
+            if self._owns_http_client:
+                # The session is recreated on next use, inside that run's event loop
+                await self.http_client.close()
         
         return models, api_calls
     
+    def _filter_page(self, page: List[Dict[str, Any]],
+                     cutoff_date: datetime) -> Tuple[List[ModelReference], bool]:
+        """
+        Filter one page of newest-first /api/models results by creation date.
+        
+        Args:
+            page: Model entries from the Hub API, sorted by creation date descending
+            cutoff_date: The cutoff date for filtering models
+            
+        Returns:
+            tuple: (ModelReference objects for recent GGUF models on the page,
+                    whether a model older than the cutoff date was reached)
+        """
+        filtered_models = []
+        for model in page:
+            try:
+                # Get model creation date
+                created_at = model.get('createdAt') or model.get('created_at')
+                
+                if created_at:
+                    # Parse the creation date
+                    if isinstance(created_at, str):
+                        model_date = date_parser.parse(created_at)
+                    else:
+                        model_date = created_at
+                    
+                    # Ensure timezone awareness
+                    if model_date.tzinfo is None:
+                        model_date = model_date.replace(tzinfo=timezone.utc)
+                    
+                    # Everything after the first model outside our date range is older
+                    if model_date < cutoff_date:
+                        return filtered_models, True
+                    
+                    # Verify this is actually a GGUF model
+                    if self._is_gguf_model(model):
+                        model_ref = ModelReference(
+                            id=model['id'],
+                            discovery_method="date_filtered",
+                            confidence_score=1.0,
+                            metadata={
+                                "created_at": model_date.isoformat(),
+                                "downloads": model.get('downloads', 0),
+                                "tags": model.get('tags', []),
+                                "author": model.get('author', ''),
+                                "pipeline_tag": model.get('pipeline_tag', '')
+                            },
+                            upload_date=model_date
+                        )
+                        filtered_models.append(model_ref)
+                else:
+                    # If no creation date, include it to be safe (recent models priority)
+                    if self.retention_config.recent_models_priority and self._is_gguf_model(model):
+                        model_ref = ModelReference(
+                            id=model['id'],
+                            discovery_method="date_filtered_no_date",
+                            confidence_score=0.8,
+                            metadata={
+                                "created_at": None,
+                                "downloads": model.get('downloads', 0),
+                                "tags": model.get('tags', []),
+                                "author": model.get('author', ''),
+                                "pipeline_tag": model.get('pipeline_tag', '')
+                            },
+                            upload_date=None
+                        )
+                        filtered_models.append(model_ref)
+                        
+            except Exception as e:
+                logger.debug(f"Error processing model {model.get('id', 'unknown')}: {e}")
+                continue
+        
+        return filtered_models, False
+    
     def _is_gguf_model(self, model) -> bool:
         """
         Check if a model is actually a GGUF model.
         
         Args:
-            model: HuggingFace model object
+            model: Model entry from the Hub API
             
         Returns:
             bool: True if the model is a GGUF model
         """
-        model_id = getattr(model, 'id', '').lower()
-        tags = [tag.lower() for tag in getattr(model, 'tags', [])]
-        
-        # Check for GGUF indicators
-        gguf_indicators = [
-            'gguf', 'ggml', '.gguf', '-gguf', '_gguf',
-            'q4_k_m', 'q4_0', 'q5_0', 'q8_0', 'f16', 'f32'
-        ]
-        
-        # Check model ID
-        if any(indicator in model_id for indicator in gguf_indicators):
+        # Check model ID for GGUF indicators and quantization patterns
+        if _GGUF_ID_RE.search(model.get('id', '').lower()):
             return True
         
-        # Check tags
-        if any(indicator in tag for tag in tags for indicator in gguf_indicators):
+        # Check tags; one search over all of them, as no pattern spans a newline
+        tags = model.get('tags')
+        if tags and _GGUF_TAG_RE.search('\n'.join(tags).lower()):
             return True
         
-        # Check for quantization patterns
-        import re
-        quantization_patterns = [
-            r'q\d+_k_[msl]', r'q\d+_\d+', r'iq\d+_[a-z]+', 
-            r'f\d+', r'bf\d+', r'int\d+'
-        ]
-        
-        for pattern in quantization_patterns:
-            if re.search(pattern, model_id):
-                return True
-        
         return False
     
+    async def aclose(self) -> None:
+        """Release network resources held by the extractor."""
+        # A caller-supplied client is shared, so its owner closes it
+        if self._owns_http_client:
+            await self.http_client.close()
+    
     async def extract_with_error_handling(self, error_recovery_system=None) -> DateFilterResult:
         """
         Extract recent models with comprehensive error handling.
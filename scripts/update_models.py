@@ -1193,6 +1193,7 @@ class HuggingFaceDataFetcher:
         """Async context manager exit."""
         if self.session:
             await self.session.close()
+        await self.completeness_monitor.aclose()
             
     async def fetch_gguf_models(self) -> Tuple[List[Dict[str, Any]], SyncMetadata]:
         """Fetch all models with GGUF files using enhanced multi-strategy discovery with sync mode support."""